@@ -11,16 +11,19 @@ const path = require('path');
 const {
   findProjectRoot,
   getMaestroDir,
-  getClaudeProjectsDir,
-  normalizeProjectPath,
+  findClaudeProjectDir,
+  findLatestJsonl,
   ensureMaestroDir,
+  hasProjectFiles,
   loadState,
   saveState,
   isReadOnlyTool,
+  DEBUG_ENABLED,
   logDebug,
   cleanAnsi,
   getTimestamp,
   readStdin,
+  pollWithBackoff,
   outputJson
 } = require('./lib/utils');
 
@@ -32,11 +35,72 @@ const {
 
 const LOG_PREFIX = '[BRAIN-SYNC]';
 
+// Events that always sync, bypassing the 30s throttle
+const PRIORITY_EVENTS = new Set(['UserPromptSubmit', 'Stop', 'SubagentStop', 'PreCompact', 'SessionStart']);
+
 // Maximum file size to read (50MB) - for full read
 // Files larger than this will use streaming
 const MAX_JSONL_SIZE = 50 * 1024 * 1024;
 const STREAMING_THRESHOLD = 50 * 1024 * 1024; // Use streaming for files > 50MB
 
+// Output fragments that indicate a failed command even when is_error is false
+const ERROR_KEYWORDS = [
+  'exit code 127', 'exit code 1', 'exit code 2', 'exit code',
+  'command not found', 'bash: command not found',
+  'is not recognized as an internal or external command',
+  'is not recognized as the name of a cmdlet',
+  'failed to compile', 'build failed', 'compilation failed',
+  'error:', 'typeerror:', 'syntaxerror:',
+  'referenceerror:', 'cannot find module', 'module not found',
+  'command failed', 'npm err!', 'npm error',
+  'fatal:', 'exception:', 'traceback',
+  'no such file or directory', 'permission denied',
+  'access is denied', 'cannot find the path specified',
+  'error: exit code', 'error exit code'
+];
+
+/**
+ * Escape a literal string for use inside a RegExp.
+ */
+function escapeRegExp(str) {
+  return str.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+// Single case-insensitive alternation: one pass over the text instead of one per keyword
+const ERROR_KEYWORDS_RE = new RegExp(ERROR_KEYWORDS.map(escapeRegExp).join('|'), 'i');
+
+// Tool name -> file change action, resolved with a single lookup per tool_use block
+const FILE_CHANGE_TOOLS = new Map([
+  ['Edit', 'edit'],
+  ['StrReplace', 'edit'],
+  ['replace_file_content', 'edit'],
+  ['multi_replace_file_content', 'edit'],
+  ['search_replace', 'edit'],
+  ['Write', 'create'],
+  ['write_to_file', 'create'],
+  ['write', 'create']
+]);
+
+// Tools whose non-error results are still checked for hidden failures
+const EXECUTION_TOOLS = new Set(['run_command', 'browser_subagent', 'execute_python_code', 'Bash', 'Shell']);
+
+// Phrases marking an assistant message as a decision (matched case-insensitively)
+const DECISION_INDICATORS = [
+  'the user wants', 'user requested', 'requirements:',
+  'architecture:', 'design decision:', 'chosen approach:',
+  'will use', 'decided to', 'going with', 'selected',
+  'because', 'reason:', 'rationale:', 'plan:', 'strategy:'
+];
+
+// Openers of transient narration that should never be stored as decisions
+const TRANSIENT_PREFIXES = [
+  'Let me', 'Now let', "I will try", "I'll try",
+  'First,', 'Next,', 'Then,', 'Now I'
+];
+
+const DECISION_RE = new RegExp(DECISION_INDICATORS.map(escapeRegExp).join('|'), 'i');
+const TRANSIENT_RE = new RegExp(`^(?:${TRANSIENT_PREFIXES.map(escapeRegExp).join('|')})`);
+
 /**
  * Detect active Claude CLI session from cwd.
  */
@@ -47,61 +111,21 @@ function getActiveSession(projectRoot) {
     // STALE CONTEXT GUARD: Detect if project is empty
     // Only check if it's a directory (might be a newly created empty folder)
     if (fs.existsSync(projectRoot) && fs.lstatSync(projectRoot).isDirectory()) {
-      const rootEntries = fs.readdirSync(projectRoot);
-      const hasProjectFiles = rootEntries.some(e => !['.git', '.maestro', '.claude'].includes(e));
-      if (!hasProjectFiles) {
+      if (!hasProjectFiles(projectRoot)) {
         logDebug(LOG_PREFIX, 'Project directory empty (except meta) - treated as FRESH START. Skipping legacy session recovery.');
         return { sessionId: null, mainJsonl: null, subagentDir: null };
       }
     }
 
-    const claudeProjectsDir = getClaudeProjectsDir();
-    if (!fs.existsSync(claudeProjectsDir)) {
-      return { sessionId: null, mainJsonl: null, subagentDir: null };
-    }
-
-    // Normalize project path for matching
-    const cwdNormalized = normalizeProjectPath(projectRoot);
-    let projectDir = null;
-
-    // Find matching project directory (case-insensitive for Windows compatibility)
-    const entries = fs.readdirSync(claudeProjectsDir);
-    // 1. Try exact match first
-    for (const entry of entries) {
-      if (entry.toLowerCase() === cwdNormalized.toLowerCase()) {
-        projectDir = path.join(claudeProjectsDir, entry);
-        break;
-      }
-    }
-
-    // 2. Try prefix match if exact match fails (case-insensitive)
-    if (!projectDir) {
-      for (const entry of entries) {
-        const entryLower = entry.toLowerCase();
-        const cwdLower = cwdNormalized.toLowerCase();
-        if (cwdLower && (entryLower.startsWith(cwdLower) || cwdLower.startsWith(entryLower))) {
-          projectDir = path.join(claudeProjectsDir, entry);
-          break;
-        }
-      }
-    }
-
+    const projectDir = findClaudeProjectDir(projectRoot);
     if (!projectDir) {
       return { sessionId: null, mainJsonl: null, subagentDir: null };
     }
 
     // Try to find session from .jsonl files
-    const jsonlFiles = fs.readdirSync(projectDir)
-      .filter(f => f.endsWith('.jsonl'))
-      .map(f => ({
-        name: f,
-        path: path.join(projectDir, f),
-        mtime: fs.statSync(path.join(projectDir, f)).mtimeMs
-      }))
-      .sort((a, b) => b.mtime - a.mtime);
-
-    if (jsonlFiles.length > 0) {
-      const latestJsonl = jsonlFiles[0];
+    const latestJsonl = findLatestJsonl(projectDir);
+
+    if (latestJsonl) {
       const sessionId = latestJsonl.name.replace('.jsonl', '');
       const mainJsonl = latestJsonl.path;
       const subagentDir = path.join(projectDir, sessionId, 'subagents');
@@ -141,9 +165,14 @@ function getActiveSession(projectRoot) {
 
 /**
  * Read JSONL file incrementally using offset tracking.
+ * When a shared syncState object is passed, offsets are only updated in
+ * memory and the caller persists them once for the whole batch.
  */
-function readJsonlIncremental(filePath, sessionId, callback) {
-  const syncState = loadState('sync', findProjectRoot()) || {};
+function readJsonlIncremental(filePath, sessionId, callback, syncState = null) {
+  const ownsState = syncState === null;
+  if (ownsState) {
+    syncState = loadState('sync', findProjectRoot()) || {};
+  }
   const fileKey = `${sessionId}:${path.basename(filePath)}`;
   const startOffset = syncState[fileKey] || 0;
 
@@ -187,17 +216,51 @@ function readJsonlIncremental(filePath, sessionId, callback) {
 
   fs.closeSync(fd);
 
+  // A trailing line without newline may still be mid-write (transcript not flushed yet).
+  // Only consume it if it parses; otherwise leave the offset before it for the next read.
+  if (leftover.trim()) {
+    try {
+      const entry = JSON.parse(leftover);
+      callback(entry);
+    } catch (err) {
+      currentOffset -= Buffer.byteLength(leftover, 'utf-8');
+    }
+  }
+
   // Save new offset
   syncState[fileKey] = currentOffset;
-  saveState('sync', syncState, findProjectRoot());
+  if (ownsState) {
+    saveState('sync', syncState, findProjectRoot());
+  }
 
   return Promise.resolve();
 }
 
+/**
+ * Convert an absolute file path to a project-relative one.
+ * Paths under the root are sliced against the known prefix; only paths
+ * outside it fall back to path.relative.
+ */
+function toRelativePath(filePath, projectRoot) {
+  try {
+    const rootPrefix = projectRoot.endsWith(path.sep) ? projectRoot : projectRoot + path.sep;
+    if (filePath.startsWith(rootPrefix)) {
+      return filePath.substring(rootPrefix.length);
+    }
+    let relPath = path.relative(projectRoot, filePath);
+    if (relPath.startsWith('.\\') || relPath.startsWith('./')) {
+      relPath = relPath.substring(2);
+    }
+    return relPath;
+  } catch (err) {
+    return path.basename(filePath);
+  }
+}
+
 /**
  * Process a single JSONL entry and extract relevant data.
  */
-function processEntry(entry, data, toolIdToName = {}) {
+function processEntry(entry, data, toolIdToName = {}, projectRoot = findProjectRoot()) {
   try {
     const entryType = entry.type;
     const timestamp = entry.timestamp || '';
@@ -224,29 +287,13 @@ function processEntry(entry, data, toolIdToName = {}) {
           // Check non-error results for hidden errors (only for execution tools)
           if (blockType === 'tool_result' && !block.is_error) {
             const currentToolName = toolName || block.name || '';
-            if (!['run_command', 'browser_subagent', 'execute_python_code', 'Bash', 'Shell'].includes(currentToolName)) {
+            if (!EXECUTION_TOOLS.has(currentToolName)) {
               continue;
             }
 
             const resultContent = cleanAnsi(block.content || '');
-            const resultLower = resultContent.toLowerCase();
-
-            const errorKeywords = [
-              'exit code 127', 'exit code 1', 'exit code 2', 'exit code',
-              'command not found', 'bash: command not found',
-              'is not recognized as an internal or external command',
-              'is not recognized as the name of a cmdlet',
-              'failed to compile', 'build failed', 'compilation failed',
-              'error:', 'typeerror:', 'syntaxerror:',
-              'referenceerror:', 'cannot find module', 'module not found',
-              'command failed', 'npm err!', 'npm error',
-              'fatal:', 'exception:', 'traceback',
-              'no such file or directory', 'permission denied',
-              'access is denied', 'cannot find the path specified',
-              'error: exit code', 'error exit code'
-            ];
-
-            if (errorKeywords.some(kw => resultLower.includes(kw))) {
+
+            if (ERROR_KEYWORDS_RE.test(resultContent)) {
               data.errors.push({
                 timestamp,
                 error: resultContent,
@@ -271,20 +318,8 @@ function processEntry(entry, data, toolIdToName = {}) {
           if (!text) continue;
 
           // Decisions
-          const decisionIndicators = [
-            'the user wants', 'user requested', 'requirements:',
-            'architecture:', 'design decision:', 'chosen approach:',
-            'will use', 'decided to', 'going with', 'selected',
-            'because', 'reason:', 'rationale:', 'plan:', 'strategy:'
-          ];
-          const skipIndicators = [
-            'Let me', 'Now let', "I will try", "I'll try",
-            'First,', 'Next,', 'Then,', 'Now I'
-          ];
-
-          const textLower = text.toLowerCase();
-          const isDecision = decisionIndicators.some(ind => textLower.includes(ind.toLowerCase()));
-          const isTransient = skipIndicators.some(skip => text.startsWith(skip));
+          const isDecision = DECISION_RE.test(text);
+          const isTransient = TRANSIENT_RE.test(text);
 
           // NEW: Detect compact/session summaries
           // Check for explicit flag (most reliable) OR pattern matching
@@ -298,15 +333,14 @@ function processEntry(entry, data, toolIdToName = {}) {
           )) && !text.includes('<local-command-stdout>');
 
           if (isSummary) {
-            data.decisions.push({
+            data.compacts.push({
               timestamp,
-              decision: `AUTO-SUMMARY: ${text.trim().replace(/\r\n/g, ' ').replace(/\n/g, ' ')}`
+              summary: text.trim().replace(/\r\n/g, ' ').replace(/\n/g, ' ')
             });
           } else if (entryType === 'assistant' && isDecision && !isTransient && text.length > 30) {
             const sentences = text.split(/[.!?]\s+/);
             for (const sentence of sentences) {
-              const sentLower = sentence.toLowerCase();
-              if (decisionIndicators.some(ind => sentLower.includes(ind.toLowerCase()))) {
+              if (DECISION_RE.test(sentence)) {
                 if (sentence.trim().length > 20) {
                   data.decisions.push({
                     timestamp,
@@ -333,20 +367,13 @@ function processEntry(entry, data, toolIdToName = {}) {
           const toolName = block.name || '';
           const toolInput = block.input || {};
 
+          const fileAction = FILE_CHANGE_TOOLS.get(toolName);
+
           // File edits
-          if (['Edit', 'StrReplace', 'replace_file_content', 'multi_replace_file_content', 'search_replace'].includes(toolName)) {
+          if (fileAction === 'edit') {
             const filePath = toolInput.file_path || toolInput.path || toolInput.AbsolutePath || toolInput.TargetFile || '';
             if (filePath) {
-              let relPath = filePath;
-              try {
-                const projectRoot = findProjectRoot();
-                relPath = path.relative(projectRoot, filePath);
-                if (relPath.startsWith('.\\') || relPath.startsWith('./')) {
-                  relPath = relPath.substring(2);
-                }
-              } catch (err) {
-                relPath = path.basename(filePath);
-              }
+              const relPath = toRelativePath(filePath, projectRoot);
 
               const description = toolInput.Instruction || toolInput.Description ||
                 (toolInput.old_string ? 'Modified content' : 'Edited');
@@ -360,19 +387,10 @@ function processEntry(entry, data, toolIdToName = {}) {
           }
 
           // File writes/creates
-          if (['Write', 'write_to_file', 'write'].includes(toolName)) {
+          if (fileAction === 'create') {
             const filePath = toolInput.file_path || toolInput.path || toolInput.AbsolutePath || '';
             if (filePath) {
-              let relPath = filePath;
-              try {
-                const projectRoot = findProjectRoot();
-                relPath = path.relative(projectRoot, filePath);
-                if (relPath.startsWith('.\\') || relPath.startsWith('./')) {
-                  relPath = relPath.substring(2);
-                }
-              } catch (err) {
-                relPath = path.basename(filePath);
-              }
+              const relPath = toRelativePath(filePath, projectRoot);
 
               const description = toolInput.contents ? 'Created file' : 'Created';
               data.fileChanges.push({
@@ -394,22 +412,27 @@ function processEntry(entry, data, toolIdToName = {}) {
 /**
  * Extract brain data from JSONL files.
  */
-async function extractBrainData(sessionId, mainJsonl, subagentDir) {
+async function extractBrainData(sessionId, mainJsonl, subagentDir, projectRoot = findProjectRoot()) {
   const data = {
     tasks: [],
     decisions: [],
+    compacts: [], // Compact/session summaries, kept apart from decisions
     errors: [],
     fileChanges: [],
     thinking: []
   };
 
+  // Offsets for every transcript are loaded once and written back once per run
+  const syncState = loadState('sync', projectRoot) || {};
+  const syncBefore = JSON.stringify(syncState);
+
   try {
     // 1. Process Main Session JSONL
     if (mainJsonl && fs.existsSync(mainJsonl)) {
       logDebug(LOG_PREFIX, `Extracting from main session: ${path.basename(mainJsonl)}`);
       await readJsonlIncremental(mainJsonl, sessionId, (entry) => {
-        processEntry(entry, data, {}); // No toolIdToName for main yet
-      });
+        processEntry(entry, data, {}, projectRoot); // No toolIdToName for main yet
+      }, syncState);
     }
 
     // 2. Process Subagent JSONL
@@ -417,7 +440,9 @@ async function extractBrainData(sessionId, mainJsonl, subagentDir) {
       const subFiles = fs.readdirSync(subagentDir)
         .filter(f => f.endsWith('.jsonl'));
 
-      // First pass: Build tool ID to name map
+      // Single pass: the incremental reader advances saved offsets, so a second
+      // read of the same file sees nothing. tool_use blocks always precede their
+      // tool_result, so the ID -> name map can be filled in as we go.
       const toolIdToName = {};
       for (const subFile of subFiles) {
         const subPath = path.join(subagentDir, subFile);
@@ -434,17 +459,8 @@ async function extractBrainData(sessionId, mainJsonl, subagentDir) {
               }
             }
           }
-        });
-      }
-
-      // Second pass: Extract data
-      for (const subFile of subFiles) {
-        const subPath = path.join(subagentDir, subFile);
-        if (!fs.existsSync(subPath)) continue;
-
-        await readJsonlIncremental(subPath, sessionId, (entry) => {
-          processEntry(entry, data, toolIdToName);
-        });
+          processEntry(entry, data, toolIdToName, projectRoot);
+        }, syncState);
       }
     }
 
@@ -452,9 +468,35 @@ async function extractBrainData(sessionId, mainJsonl, subagentDir) {
     logDebug(LOG_PREFIX, `Extraction error: ${err.message}`);
   }
 
+  // Nothing new in any transcript: offsets are unchanged, so skip the save entirely
+  if (JSON.stringify(syncState) !== syncBefore) {
+    saveState('sync', syncState, projectRoot);
+  }
+
   return data;
 }
 
+/**
+ * Append the buckets of one extraction result onto another.
+ */
+function mergeBrainData(target, source) {
+  for (const key of Object.keys(source)) {
+    target[key] = [...(target[key] || []), ...source[key]];
+  }
+  return target;
+}
+
+// Project-type keywords looked for in early/late thinking
+const PROJECT_INDICATORS = [
+  'next.js', 'react', 'vue', 'angular', 'express', 'django', 'flask',
+  'kindle', 'e-reader', 'dashboard', 'landing', 'api', 'extension',
+  'news', 'blog', 'portfolio', 'ecommerce', 'app', 'tool', 'script'
+];
+
+// Progress noise in command output vs. words that make a line worth keeping anyway
+const JUNK_LINE_PATTERNS = ['starting', 'running', 'inspecting', '...', '---'];
+const ERROR_LINE_WORDS = ['error', 'fail', 'exception', 'invalid', 'not found', 'denied'];
+
 /**
  * Compress verbose brain data into compact context summary.
  */
@@ -479,16 +521,10 @@ function compressToContext(data) {
       ...data.thinking.slice(-3)
     ];
 
-    const indicators = [
-      'next.js', 'react', 'vue', 'angular', 'express', 'django', 'flask',
-      'kindle', 'e-reader', 'dashboard', 'landing', 'api', 'extension',
-      'news', 'blog', 'portfolio', 'ecommerce', 'app', 'tool', 'script'
-    ];
-
     const foundIndicators = [];
     for (const t of thoughtsToCheck) {
       const thought = t.thought.toLowerCase();
-      for (const ind of indicators) {
+      for (const ind of PROJECT_INDICATORS) {
         if (thought.includes(ind) && !foundIndicators.includes(ind)) {
           foundIndicators.push(ind);
         }
@@ -530,9 +566,10 @@ function compressToContext(data) {
     }
 
     let errKey = null;
+    const errLower = errText.toLowerCase(); // Lowercased once for all checks below
 
     // TypeScript/ESLint errors
-    if (errText.toLowerCase().includes('error:')) {
+    if (errLower.includes('error:')) {
       for (const line of errText.split('\n')) {
         if (line.toLowerCase().includes('error') && line.includes(':')) {
           errKey = line.trim().substring(0, 500);
@@ -542,19 +579,16 @@ function compressToContext(data) {
     }
 
     // Exit code or command failures (including Windows bash errors)
-    if (!errKey && (errText.toLowerCase().includes('exit code') ||
-      errText.toLowerCase().includes('command not found') ||
-      errText.toLowerCase().includes('bash:') ||
-      errText.toLowerCase().includes('error: exit code'))) {
+    if (!errKey && (errLower.includes('exit code') ||
+      errLower.includes('command not found') ||
+      errLower.includes('bash:') ||
+      errLower.includes('error: exit code'))) {
       const lines = errText.split('\n').filter(l => l.trim());
-      const junkPatterns = ['starting', 'running', 'inspecting', '...', '---'];
 
       const meaningfulLines = lines.filter(line => {
         const lineLower = line.toLowerCase();
-        const isJunk = junkPatterns.some(jp => lineLower.includes(jp));
-        const hasError = ['error', 'fail', 'exception', 'invalid', 'not found', 'denied']
-          .some(ew => lineLower.includes(ew));
-        return !isJunk || hasError;
+        const isJunk = JUNK_LINE_PATTERNS.some(jp => lineLower.includes(jp));
+        return !isJunk || ERROR_LINE_WORDS.some(ew => lineLower.includes(ew));
       });
 
       if (meaningfulLines.length > 0) {
@@ -568,7 +602,7 @@ function compressToContext(data) {
     }
 
     // Build/compile errors
-    if (!errKey && errText.toLowerCase().includes('failed')) {
+    if (!errKey && errLower.includes('failed')) {
       errKey = errText.split('\n')[0]?.substring(0, 500);
     }
 
@@ -585,21 +619,39 @@ function compressToContext(data) {
     context.blockers.push(context.lastError);
   }
 
-  // Extract key decisions and separate AUTO-SUMMARY (compact) entries
-  // We process ALL decisions in the chunk to ensure we don't miss summaries
+  // Compact summaries are bucketed at extraction time, so no prefix scan is needed
+  for (const comp of data.compacts) {
+    context.compactSummaries.push(comp.summary);
+  }
+
   for (const dec of data.decisions) {
-    const decisionText = dec.decision || '';
-    // Check if it's an AUTO-SUMMARY (compact)
-    if (decisionText.startsWith('AUTO-SUMMARY:')) {
-      context.compactSummaries.push(decisionText.substring(13).trim()); // Remove "AUTO-SUMMARY: " prefix
-    } else {
-      context.keyDecisions.push(decisionText.trim().substring(0, 1000));
-    }
+    context.keyDecisions.push((dec.decision || '').trim().substring(0, 1000));
   }
 
   return context;
 }
 
+/**
+ * Append items to a list of brain entries, skipping any whose text is already present.
+ * Keys are tracked in a Set so each merge is linear instead of rescanning the list per item.
+ * 
+ * @param {Array<object>} entries - Existing entries (mutated)
+ * @param {Array<string>} items - New texts to add
+ * @param {function(object): string} keyOf - Text of an existing entry
+ * @param {function(string): object} makeEntry - Build an entry for a new text
+ * @returns {Array<object>} The same entries array
+ */
+function appendUnique(entries, items, keyOf, makeEntry) {
+  const seen = new Set(entries.map(keyOf));
+  for (const item of items) {
+    if (!seen.has(item)) {
+      seen.add(item);
+      entries.push(makeEntry(item));
+    }
+  }
+  return entries;
+}
+
 /**
  * Write brain.jsonl with consolidated data.
  */
@@ -607,6 +659,7 @@ function writeBrainJsonl(sessionId, data, projectRoot) {
   try {
     const preserved = readPreservedBrain(projectRoot);
     const context = compressToContext(data);
+    const ts = getTimestamp(); // One timestamp for every entry created in this write
 
     const entries = [];
 
@@ -614,7 +667,7 @@ function writeBrainJsonl(sessionId, data, projectRoot) {
     entries.push(...preserved.tech);
 
     // 2. Compact summaries (preserved + new, keep last 10)
-    const allCompactsRaw = [...preserved.compacts, ...context.compactSummaries.map(s => ({ type: 'compact', summary: s, ts: getTimestamp() }))];
+    const allCompactsRaw = [...preserved.compacts, ...context.compactSummaries.map(s => ({ type: 'compact', summary: s, ts }))];
     const uniqueCompacts = [];
     const seenCompacts = new Set();
     for (const e of allCompactsRaw) {
@@ -627,43 +680,28 @@ function writeBrainJsonl(sessionId, data, projectRoot) {
     entries.push(...uniqueCompacts.slice(-10));
 
     // 3. Goals (preserved + new)
-    const allGoalsRaw = [...preserved.goals];
-    if (context.projectInfo) {
-      const exists = allGoalsRaw.some(e => (e.content || '') === context.projectInfo);
-      if (!exists) {
-        allGoalsRaw.push({ type: 'goal', content: context.projectInfo, ts: getTimestamp() });
-      }
-    }
+    const allGoalsRaw = appendUnique([...preserved.goals],
+      context.projectInfo ? [context.projectInfo] : [],
+      e => e.content || '',
+      content => ({ type: 'goal', content, ts }));
     entries.push(...allGoalsRaw.slice(-20));
 
     // 4. Decisions (merged & deduplicated)
-    const allDecisionsRaw = [...preserved.decisions];
-    for (const dec of context.keyDecisions) {
-      const exists = allDecisionsRaw.some(e => (e.content || e.decision || '') === dec);
-      if (!exists) {
-        allDecisionsRaw.push({ type: 'decision', content: dec, session: sessionId });
-      }
-    }
+    const allDecisionsRaw = appendUnique([...preserved.decisions], context.keyDecisions,
+      e => e.content || e.decision || '',
+      content => ({ type: 'decision', content, session: sessionId }));
     entries.push(...allDecisionsRaw.slice(-30));
 
     // 5. Completed items
-    const allCompletedRaw = [...preserved.completed];
-    for (const comp of context.completed) {
-      const exists = allCompletedRaw.some(e => (e.content || '') === comp);
-      if (!exists) {
-        allCompletedRaw.push({ type: 'completed', content: comp });
-      }
-    }
+    const allCompletedRaw = appendUnique([...preserved.completed], context.completed,
+      e => e.content || '',
+      content => ({ type: 'completed', content }));
     entries.push(...allCompletedRaw.slice(-30));
 
     // 6. Errors/Blockers
-    const allErrorsRaw = [...preserved.errors];
-    for (const err of [...context.errors, ...context.blockers]) {
-      const exists = allErrorsRaw.some(e => (e.content || e.error || '') === err);
-      if (!exists) {
-        allErrorsRaw.push({ type: 'error', content: err });
-      }
-    }
+    const allErrorsRaw = appendUnique([...preserved.errors], [...context.errors, ...context.blockers],
+      e => e.content || e.error || '',
+      content => ({ type: 'error', content }));
     entries.push(...allErrorsRaw.slice(-20));
 
     // 8. Others (preserve everything else)
@@ -715,23 +753,7 @@ function extractErrorsFromHookInput(hookInput) {
     const isError = toolResult.is_error || toolResult.isError ||
       hookInput.isError || false;
 
-    const contentLower = content.toLowerCase();
-    const errorKeywords = [
-      'exit code 127', 'exit code 1', 'exit code 2', 'exit code',
-      'command not found', 'bash: command not found',
-      'is not recognized as an internal or external command',
-      'is not recognized as the name of a cmdlet',
-      'failed to compile', 'build failed', 'compilation failed',
-      'error:', 'typeerror:', 'syntaxerror:',
-      'referenceerror:', 'cannot find module', 'module not found',
-      'command failed', 'npm err!', 'npm error',
-      'fatal:', 'exception:', 'traceback',
-      'no such file or directory', 'permission denied',
-      'access is denied', 'cannot find the path specified',
-      'error: exit code', 'error exit code'
-    ];
-
-    const hasError = isError || errorKeywords.some(kw => contentLower.includes(kw));
+    const hasError = isError || ERROR_KEYWORDS_RE.test(content);
 
     if (hasError && content.length > 5) {
       errors.push({
@@ -739,7 +761,9 @@ function extractErrorsFromHookInput(hookInput) {
         error: content.substring(0, 1000),
         tool: toolName
       });
-      logDebug(LOG_PREFIX, `Captured error from hook input: ${toolName} - ${content.substring(0, 100)}`);
+      if (DEBUG_ENABLED) {
+        logDebug(LOG_PREFIX, `Captured error from hook input: ${toolName} - ${content.substring(0, 100)}`);
+      }
     }
 
   } catch (err) {
@@ -759,38 +783,27 @@ function writeErrorsToBrain(errors, projectRoot) {
 
   try {
     const preserved = readPreservedBrain(projectRoot);
-    const entries = [];
-
-    // Preserve tech entries
-    for (const techEntry of preserved.techEntries) {
-      entries.push(techEntry);
-    }
-
-    // Preserve existing errors
-    const existingErrors = preserved.errors || [];
-    const allErrors = [...existingErrors];
-
-    // Add new errors
-    for (const err of errors) {
-      const errText = err.error || '';
-      const toolName = err.tool || '';
-      const errorEntry = toolName ? `[${toolName}] ${errText}` : errText;
-
-      if (errText.length > 10 && !allErrors.includes(errorEntry)) {
-        allErrors.push(errorEntry);
-      }
-    }
-
-    // Keep last 20 errors
-    for (const err of allErrors.slice(-20)) {
-      entries.push({
-        type: 'error',
-        content: err,
-        ts: getTimestamp()
-      });
-    }
+    const ts = getTimestamp();
+
+    // Add new errors after the existing ones (Set-backed dedupe via appendUnique)
+    const newErrors = errors
+      .filter(err => (err.error || '').length > 10)
+      .map(err => (err.tool ? `[${err.tool}] ${err.error}` : err.error));
+    const allErrors = appendUnique([...preserved.errors], newErrors,
+      e => e.content || e.error || '',
+      content => ({ type: 'error', content, ts }));
+
+    // Every other category is carried over untouched; only errors change (keep last 20)
+    const entries = [
+      ...preserved.tech,
+      ...preserved.compacts,
+      ...preserved.goals,
+      ...preserved.decisions,
+      ...preserved.completed,
+      ...allErrors.slice(-20),
+      ...preserved.others
+    ];
 
-    const { writeBrain } = require('./lib/brain');
     writeBrain(entries, projectRoot);
     logDebug(LOG_PREFIX, `Wrote ${errors.length} errors to brain.jsonl (fallback)`);
 
@@ -807,7 +820,9 @@ async function main() {
 
   try {
     const hookInput = await readStdin();
-    logDebug(LOG_PREFIX, `Hook input keys: ${Object.keys(hookInput || {}).join(', ')}`);
+    if (DEBUG_ENABLED) {
+      logDebug(LOG_PREFIX, `Hook input keys: ${Object.keys(hookInput || {}).join(', ')}`);
+    }
     const eventName = hookInput.hook_event_name || hookInput.hookEventName || '';
     const toolName = hookInput.toolName || (hookInput.toolResult && hookInput.toolResult.tool_name) || '';
 
@@ -824,7 +839,6 @@ async function main() {
     const immediateErrors = extractErrorsFromHookInput(hookInput);
     if (immediateErrors.length > 0) {
       logDebug(LOG_PREFIX, `Found ${immediateErrors.length} immediate errors`);
-      writeErrorsToBrain(immediateErrors, projectRoot);
     }
 
     // Detect session
@@ -833,20 +847,22 @@ async function main() {
     if (!sessionId) {
       // Even without session, we can write errors
       if (immediateErrors.length > 0) {
+        writeErrorsToBrain(immediateErrors, projectRoot);
         logDebug(LOG_PREFIX, 'Session not found, but errors written');
       }
       outputJson({});
       return;
     }
 
+    // With a session, immediate errors are merged into the single brain write below
+
     // Throttling: 
     // If no immediate errors and the last sync was very recent, consider skipping
     // to avoid excessive JSONL parsing on every tool use.
     // BYPASS throttling for critical events to ensure memory continuity.
-    const priorityEvents = ['UserPromptSubmit', 'Stop', 'SubagentStop', 'PreCompact', 'SessionStart'];
     const state = loadState('brain-sync', projectRoot) || {};
     const now = Date.now();
-    const isPriorityEvent = priorityEvents.includes(eventName) || immediateErrors.length > 0;
+    const isPriorityEvent = PRIORITY_EVENTS.has(eventName) || immediateErrors.length > 0;
 
     if (!isPriorityEvent && state.lastSync && (now - state.lastSync < 30000)) {
       logDebug(LOG_PREFIX, `Throttling sync (last one was < 30s ago). Event: ${eventName}`);
@@ -859,14 +875,18 @@ async function main() {
     let data;
     if (eventName === 'Stop' || eventName === 'PreCompact') {
       logDebug(LOG_PREFIX, 'Stop/PreCompact event: using retry logic for transcript flush');
-      for (let attempt = 1; attempt <= 3; attempt++) {
-        data = await extractBrainData(sessionId, mainJsonl, subagentDir);
-        // If we found a compact summary that isn't already the last one in our brain, we're good
-        if (data.compact && data.compact.length > 0) break;
-        if (attempt < 3) await new Promise(r => setTimeout(r, 1000));
-      }
+      // Each attempt only sees bytes appended since the previous one (offsets advance),
+      // so results are accumulated rather than replaced.
+      data = null;
+      await pollWithBackoff(async (attempt) => {
+        const chunk = await extractBrainData(sessionId, mainJsonl, subagentDir, projectRoot);
+        data = data ? mergeBrainData(data, chunk) : chunk;
+        logDebug(LOG_PREFIX, `Flush attempt ${attempt}: ${data.compacts.length} summaries so far`);
+        // Done as soon as the compact summary has been flushed
+        return data.compacts.length > 0;
+      }, { timeoutMs: 2000 });
     } else {
-      data = await extractBrainData(sessionId, mainJsonl, subagentDir);
+      data = await extractBrainData(sessionId, mainJsonl, subagentDir, projectRoot);
     }
 
     // Merge immediate errors
@@ -7,10 +7,22 @@
 
 const fs = require('fs');
 const path = require('path');
-const { getMaestroDir, ensureMaestroDir, getTimestamp, logDebug } = require('./utils');
+const { getMaestroDir, ensureMaestroDir, writeFileAtomic, getTimestamp, logDebug } = require('./utils');
 
 const LOG_PREFIX = '[BRAIN]';
 
+// Entry type -> readPreservedBrain() bucket; unknown types land in 'others'
+const PRESERVED_BUCKETS = new Map([
+  ['tech_stack', 'tech'],
+  ['architecture', 'tech'],
+  ['scripts', 'tech'],
+  ['compact', 'compacts'],
+  ['error', 'errors'],
+  ['decision', 'decisions'],
+  ['completed', 'completed'],
+  ['goal', 'goals']
+]);
+
 /**
  * Get brain.jsonl file path.
  * 
@@ -21,8 +33,22 @@ function getBrainPath(projectRoot = null) {
   return path.join(getMaestroDir(projectRoot), 'brain.jsonl');
 }
 
+// Parsed brain.jsonl per path, reused while mtime and size are unchanged
+const brainCache = new Map();
+
+/**
+ * Drop the cached parse for a brain file after this process writes it.
+ * 
+ * @param {string} brainPath - brain.jsonl path
+ */
+function invalidateBrainCache(brainPath) {
+  brainCache.delete(brainPath);
+}
+
 /**
  * Read all entries from brain.jsonl.
+ * Parsed entries are cached by (mtime, size), so repeat reads within a
+ * hook run skip the parse. Callers get a fresh array each time.
  * 
  * @param {string} [projectRoot] - Project root path
  * @returns {Array<object>} Array of brain entries
@@ -31,21 +57,37 @@ function readBrain(projectRoot = null) {
   const brainPath = getBrainPath(projectRoot);
   const entries = [];
 
-  if (!fs.existsSync(brainPath)) {
+  let stat;
+  try {
+    stat = fs.statSync(brainPath, { bigint: true });
+  } catch (err) {
     return entries;
   }
 
+  const cached = brainCache.get(brainPath);
+  if (cached && cached.mtimeNs === stat.mtimeNs && cached.size === stat.size) {
+    return cached.entries.slice();
+  }
+
   try {
     const content = fs.readFileSync(brainPath, 'utf-8');
-    const lines = content.split('\n').filter(line => line.trim());
 
-    for (const line of lines) {
+    // Walk newline offsets directly: no intermediate split/filter arrays
+    let start = 0;
+    while (start < content.length) {
+      let end = content.indexOf('\n', start);
+      if (end === -1) end = content.length;
+      const line = content.slice(start, end);
+      start = end + 1;
+      if (!line.trim()) continue;
+
       try {
         entries.push(JSON.parse(line));
       } catch (err) {
         logDebug(LOG_PREFIX, `Failed to parse line: ${line.substring(0, 50)}...`);
       }
     }
+    brainCache.set(brainPath, { mtimeNs: stat.mtimeNs, size: stat.size, entries: entries.slice() });
   } catch (err) {
     logDebug(LOG_PREFIX, `Error reading brain: ${err.message}`);
   }
@@ -65,7 +107,14 @@ function writeBrain(entries, projectRoot = null) {
 
   try {
     const content = entries.map(e => JSON.stringify(e)).join('\n') + '\n';
-    fs.writeFileSync(brainPath, content, 'utf-8');
+
+    // Temp file + rename so a crash never leaves a truncated brain; unchanged
+    // content is skipped so mtime stays put for watchers and the read cache
+    invalidateBrainCache(brainPath);
+    if (!writeFileAtomic(brainPath, content)) {
+      logDebug(LOG_PREFIX, 'brain.jsonl unchanged, skipping write');
+      return;
+    }
     logDebug(LOG_PREFIX, `Wrote ${entries.length} entries to brain.jsonl`);
   } catch (err) {
     logDebug(LOG_PREFIX, `Error writing brain: ${err.message}`);
@@ -83,6 +132,7 @@ function appendToBrain(entry, projectRoot = null) {
   const brainPath = path.join(maestroDir, 'brain.jsonl');
 
   try {
+    invalidateBrainCache(brainPath);
     fs.appendFileSync(brainPath, JSON.stringify(entry) + '\n', 'utf-8');
     logDebug(LOG_PREFIX, `Appended entry type=${entry.type} to brain.jsonl`);
   } catch (err) {
@@ -123,28 +173,36 @@ function readPreservedBrain(projectRoot = null) {
   const entries = readBrain(projectRoot);
 
   for (const entry of entries) {
-    const type = entry.type;
-
-    if (['tech_stack', 'architecture', 'scripts'].includes(type)) {
-      preserved.tech.push(entry);
-    } else if (type === 'compact') {
-      preserved.compacts.push(entry);
-    } else if (type === 'error') {
-      preserved.errors.push(entry);
-    } else if (type === 'decision') {
-      preserved.decisions.push(entry);
-    } else if (type === 'completed') {
-      preserved.completed.push(entry);
-    } else if (type === 'goal') {
-      preserved.goals.push(entry);
-    } else {
-      preserved.others.push(entry);
-    }
+    const bucket = PRESERVED_BUCKETS.get(entry.type) || 'others';
+    preserved[bucket].push(entry);
   }
 
   return preserved;
 }
 
+// How many of the most recent items per category formatBrainForContext shows.
+// Categories are collected already capped, so this is the only place the limits live.
+const RECENT_LIMITS = new Map([
+  ['goal', 3],
+  ['decision', 3], // Reduced from 5 to 3
+  ['completed', 3], // Reduced from 5 to 3
+  ['error', 2] // Reduced from 3 to 2
+]);
+
+/**
+ * Append to a list that only ever holds the last `limit` items.
+ * 
+ * @param {Array} list - Bounded list (mutated)
+ * @param {*} item - Item to append
+ * @param {number} limit - Maximum length
+ */
+function pushRecent(list, item, limit) {
+  list.push(item);
+  if (list.length > limit) {
+    list.shift();
+  }
+}
+
 /**
  * Format brain.jsonl for AI context display.
  * 
@@ -168,6 +226,7 @@ function formatBrainForContext(projectRoot = null) {
     scripts: null,
     compact: []
   };
+  let latestCompact = null;
 
   for (const entry of entries) {
     const type = entry.type;
@@ -179,19 +238,22 @@ function formatBrainForContext(projectRoot = null) {
     } else if (type === 'scripts') {
       categories.scripts = entry;
     } else if (type === 'compact') {
-      const ts = entry.ts || '';
-      const summary = entry.summary || '';
-      if (summary) {
-        categories.compact.push(`[${ts}] ${summary}`);
+      // Only the latest summary is shown; keep the entry and format it once below
+      if (entry.summary) {
+        latestCompact = entry;
       }
-    } else if (categories[type] !== undefined) {
+    } else if (RECENT_LIMITS.has(type)) {
       const content = entry.content || entry.decision || entry.error;
       if (content) {
-        categories[type].push(content);
+        pushRecent(categories[type], content, RECENT_LIMITS.get(type));
       }
     }
   }
 
+  if (latestCompact) {
+    categories.compact.push(`[${latestCompact.ts || ''}] ${latestCompact.summary}`);
+  }
+
   const output = [];
 
   // Tech Stack Section
@@ -249,14 +311,14 @@ function formatBrainForContext(projectRoot = null) {
   // Standard Brain Sections
   if (categories.goal.length > 0) {
     output.push('\n### 🎯 Project Goals');
-    for (const g of categories.goal.slice(-3)) {
+    for (const g of categories.goal) {
       output.push(`- ${g}`);
     }
   }
 
   if (categories.decision.length > 0) {
     output.push('\n### 🧠 Key Decisions');
-    for (const d of categories.decision.slice(-3)) { // Reduced from 5 to 3
+    for (const d of categories.decision) {
       // Truncate long decisions
       const decisionText = d.length > 200 ? d.substring(0, 200) + '...' : d;
       output.push(`- ${decisionText}`);
@@ -265,7 +327,7 @@ function formatBrainForContext(projectRoot = null) {
 
   if (categories.completed.length > 0) {
     output.push('\n### ✅ Completed');
-    for (const c of categories.completed.slice(-3)) { // Reduced from 5 to 3
+    for (const c of categories.completed) {
       // Truncate long completed items
       const completedText = c.length > 150 ? c.substring(0, 150) + '...' : c;
       output.push(`- ${completedText}`);
@@ -274,7 +336,7 @@ function formatBrainForContext(projectRoot = null) {
 
   if (categories.error.length > 0) {
     output.push('\n### 🚓 Known Issues/Errors');
-    for (const e of categories.error.slice(-2)) { // Reduced from 3 to 2
+    for (const e of categories.error) {
       // Truncate long errors
       const errorText = e.length > 300 ? e.substring(0, 300) + '...' : e;
       output.push(`- ${errorText}`);
@@ -353,8 +415,73 @@ function dedupe(arr) {
   return [...new Set(arr)];
 }
 
+/**
+ * Detect whether a transcript line holds a compact summary.
+ * 
+ * @param {string} line - Raw JSONL line
+ * @returns {string|null} Summary text or null
+ */
+function matchSummaryLine(line) {
+  let entry;
+  try {
+    entry = JSON.parse(line);
+  } catch (err) {
+    return null; // Skip invalid JSON lines
+  }
+
+  // DETECTION 1: Explicit flag (The most reliable way in new Claude Code versions)
+  if (entry.isCompactSummary || entry.is_compact_summary) {
+    let explicitText = null;
+    const content = entry.message?.content;
+    if (typeof content === 'string') {
+      explicitText = content;
+    } else if (Array.isArray(content)) {
+      for (const block of content) {
+        if (block.type === 'text') {
+          explicitText = block.text;
+          // Don't break here, take the last text block if multiple exist
+        }
+      }
+    }
+    if (explicitText) return explicitText; // Found explicit summary
+  }
+
+  // DETECTION 2: Pattern matching (fallback)
+  if (entry.type === 'assistant' || entry.type === 'user') { // Sometimes summaries appear as user messages in compact
+    const msgContent = entry.message?.content;
+    if (!msgContent) return null;
+
+    // Normalize to array of text blocks
+    const blocks = typeof msgContent === 'string'
+      ? [{ type: 'text', text: msgContent }]
+      : (Array.isArray(msgContent) ? msgContent : []);
+
+    for (const block of blocks) {
+      if (block.type === 'text') {
+        const text = block.text || '';
+
+        // Keywords and length check
+        // We tightened the check to avoid false positives
+        const isSummary = text.length > 50 && (
+          (text.includes('This session is being continued from a previous conversation')) ||
+          (text.includes('The following is a compact summary')) ||
+          (text.includes('compact') && text.includes('summary') && text.includes('context'))
+        ) && !text.includes('<local-command-stdout>');
+
+        if (isSummary) {
+          return text; // Found highly probable summary
+        }
+      }
+    }
+  }
+
+  return null;
+}
+
 /**
  * Extract the last assistant message (likely the compact summary) from a transcript.
+ * Reads the file backwards in fixed-size chunks, so only the tail that
+ * precedes the latest summary is ever loaded.
  * 
  * @param {string} transcriptPath - Path to JSONL transcript
  * @returns {string|null} Extracted summary or null
@@ -364,6 +491,7 @@ function extractLastSummary(transcriptPath) {
     return null;
   }
 
+  let fd = null;
   try {
     // Safety check for exceptionally large transcripts
     const stats = fs.statSync(transcriptPath);
@@ -372,70 +500,57 @@ function extractLastSummary(transcriptPath) {
       return null;
     }
 
-    const content = fs.readFileSync(transcriptPath, 'utf-8');
-    const lines = content.split('\n').filter(l => l.trim());
-
-    let lastAssistantMessage = null;
-
-    // Read backwards to find last message that looks like a summary
-    for (let i = lines.length - 1; i >= 0; i--) {
-      try {
-        const entry = JSON.parse(lines[i]);
-
-        // DETECTION 1: Explicit flag (The most reliable way in new Claude Code versions)
-        if (entry.isCompactSummary || entry.is_compact_summary) {
-          const content = entry.message?.content;
-          if (typeof content === 'string') {
-            lastAssistantMessage = content;
-          } else if (Array.isArray(content)) {
-            for (const block of content) {
-              if (block.type === 'text') {
-                lastAssistantMessage = block.text;
-                // Don't break here, take the last text block if multiple exist
-              }
-            }
-          }
-          if (lastAssistantMessage) return lastAssistantMessage; // Found explicit summary, return immediately
+    fd = fs.openSync(transcriptPath, 'r');
+    const chunkSize = 64 * 1024;
+    let position = stats.size;
+    // Chunks of a line that started before the current chunk, in reverse file order.
+    // Kept as a list and joined only once the line is complete, so a huge
+    // final line is not re-copied for every chunk read.
+    let tailParts = [];
+
+    // Read backwards; lines are split on raw bytes so multi-byte chars never straddle a decode
+    while (position > 0) {
+      const readSize = Math.min(chunkSize, position);
+      position -= readSize;
+      const chunk = Buffer.alloc(readSize);
+      fs.readSync(fd, chunk, 0, readSize, position);
+
+      let lineEnd = chunk.length;
+      let newline = chunk.lastIndexOf(0x0a, lineEnd - 1);
+
+      while (newline !== -1) {
+        let line;
+        if (tailParts.length > 0) {
+          line = Buffer.concat([chunk.subarray(newline + 1, lineEnd), ...tailParts.reverse()]).toString('utf-8');
+          tailParts = [];
+        } else {
+          line = chunk.toString('utf-8', newline + 1, lineEnd);
         }
-
-        // DETECTION 2: Pattern matching (fallback)
-        if (entry.type === 'assistant' || entry.type === 'user') { // Sometimes summaries appear as user messages in compact
-          const msgContent = entry.message?.content;
-          if (!msgContent) continue;
-
-          // Normalize to array of text blocks
-          const blocks = typeof msgContent === 'string'
-            ? [{ type: 'text', text: msgContent }]
-            : (Array.isArray(msgContent) ? msgContent : []);
-
-          for (const block of blocks) {
-            if (block.type === 'text') {
-              const text = block.text || '';
-
-              // Keywords and length check
-              // We tightened the check to avoid false positives
-              const isSummary = text.length > 50 && (
-                (text.includes('This session is being continued from a previous conversation')) ||
-                (text.includes('The following is a compact summary')) ||
-                (text.includes('compact') && text.includes('summary') && text.includes('context'))
-              ) && !text.includes('<local-command-stdout>');
-
-              if (isSummary) {
-                lastAssistantMessage = text;
-                return lastAssistantMessage; // Found highly probable summary, return immediately (since we read backwards)
-              }
-            }
-          }
+        if (line.trim()) {
+          const summary = matchSummaryLine(line);
+          if (summary) return summary;
         }
-      } catch (err) {
-        // Skip invalid JSON lines
+        lineEnd = newline;
+        newline = lineEnd > 0 ? chunk.lastIndexOf(0x0a, lineEnd - 1) : -1;
       }
+
+      if (lineEnd > 0) tailParts.push(chunk.subarray(0, lineEnd));
     }
 
-    return lastAssistantMessage;
+    // First line of the file
+    const firstLine = Buffer.concat(tailParts.reverse()).toString('utf-8');
+    if (firstLine.trim()) {
+      return matchSummaryLine(firstLine);
+    }
+
+    return null;
   } catch (err) {
     logDebug('[BRAIN]', `Error extracting summary: ${err.message}`);
     return null;
+  } finally {
+    if (fd !== null) {
+      try { fs.closeSync(fd); } catch (err) { /* ignore */ }
+    }
   }
 }
 
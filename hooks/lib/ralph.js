@@ -16,6 +16,7 @@ const path = require('path');
 const {
   findProjectRoot,
   getMaestroDir,
+  writeFileAtomic,
   logDebug
 } = require('./utils');
 
@@ -68,15 +69,14 @@ function getActiveFilePath() {
  */
 function readState() {
   const statePath = getStateFilePath();
-  if (!fs.existsSync(statePath)) {
-    return null;
-  }
 
   try {
     const content = fs.readFileSync(statePath, 'utf8');
     return JSON.parse(content);
   } catch (err) {
-    logDebug(LOG_PREFIX, `Error reading state: ${err.message}`);
+    if (err.code !== 'ENOENT') {
+      logDebug(LOG_PREFIX, `Error reading state: ${err.message}`);
+    }
     return null;
   }
 }
@@ -90,12 +90,11 @@ function writeState(state) {
   const maestroDir = path.dirname(statePath);
 
   // Ensure .maestro directory exists
-  if (!fs.existsSync(maestroDir)) {
-    fs.mkdirSync(maestroDir, { recursive: true });
-  }
+  fs.mkdirSync(maestroDir, { recursive: true });
 
   state.lastUpdate = Date.now();
-  fs.writeFileSync(statePath, JSON.stringify(state, null, 2));
+  // Compact JSON via temp file + rename: readers never see a half-written state
+  writeFileAtomic(statePath, JSON.stringify(state));
   logDebug(LOG_PREFIX, `State updated: ${state.current}/${state.max}`);
 }
 
@@ -177,13 +176,10 @@ function shouldContinue() {
  * @returns {Object} Block decision
  */
 function getBlockDecision() {
-  if (!isActive()) {
-    return { block: false, reason: 'Ralph not active' };
-  }
-
+  // Read state once and reuse it for the active check and the increment
   const state = readState();
-  if (!state) {
-    return { block: false, reason: 'No state found' };
+  if (!state || !fs.existsSync(getActiveFilePath())) {
+    return { block: false, reason: 'Ralph not active' };
   }
 
   // Check completion signal
@@ -192,19 +188,17 @@ function getBlockDecision() {
     return { block: false, reason: 'Completion signal detected', completed: true };
   }
 
-  // Increment iteration
-  const newState = incrementIteration();
-  if (!newState) {
-    return { block: false, reason: 'Failed to increment' };
-  }
+  // Increment iteration on the state already in hand
+  state.current++;
+  writeState(state);
 
   // Check if should continue
-  if (newState.current <= newState.max) {
+  if (state.current <= state.max) {
     return {
       block: true,
-      reason: `Iteration ${newState.current}/${newState.max}`,
-      current: newState.current,
-      max: newState.max
+      reason: `Iteration ${state.current}/${state.max}`,
+      current: state.current,
+      max: state.max
     };
   }
 
@@ -218,14 +212,27 @@ function markComplete() {
   const completePath = getCompleteFilePath();
   const maestroDir = path.dirname(completePath);
 
-  if (!fs.existsSync(maestroDir)) {
-    fs.mkdirSync(maestroDir, { recursive: true });
-  }
+  fs.mkdirSync(maestroDir, { recursive: true });
 
   fs.writeFileSync(completePath, 'completed');
   logDebug(LOG_PREFIX, 'Marked as complete');
 }
 
+/**
+ * Delete a file, treating "already gone" as success.
+ * Avoids a separate exists check before each unlink.
+ * @param {string} filePath - File to delete
+ */
+function removeIfExists(filePath) {
+  try {
+    fs.unlinkSync(filePath);
+  } catch (err) {
+    if (err.code !== 'ENOENT') {
+      throw err;
+    }
+  }
+}
+
 /**
  * Clear Ralph state (cleanup)
  */
@@ -234,14 +241,8 @@ function clearState() {
   const activePath = getActiveFilePath();
   const completePath = getCompleteFilePath();
 
-  if (fs.existsSync(statePath)) {
-    fs.unlinkSync(statePath);
-  }
-  if (fs.existsSync(activePath)) {
-    fs.unlinkSync(activePath);
-  }
-  if (fs.existsSync(completePath)) {
-    fs.unlinkSync(completePath);
+  for (const filePath of [statePath, activePath, completePath]) {
+    removeIfExists(filePath);
   }
 
   logDebug(LOG_PREFIX, 'State cleared');
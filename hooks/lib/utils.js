@@ -9,6 +9,9 @@ const fs = require('fs');
 const path = require('path');
 const os = require('os');
 
+// Resolved roots keyed by env overrides + start directory (hooks resolve the same root many times)
+const projectRootCache = new Map();
+
 /**
  * Find the project root directory.
  * 
@@ -17,10 +20,30 @@ const os = require('os');
  * 2. CLAUDE_WORKING_DIR environment variable (fallback)
  * 3. Search upward from current directory for root markers
  * 
+ * Results are memoized per process.
+ * 
  * @param {string} [startDir] - Starting directory for search
  * @returns {string} Project root path
  */
 function findProjectRoot(startDir = null) {
+  const cacheKey = `${process.env.CLAUDE_PROJECT_DIR || ''}\0${process.env.CLAUDE_WORKING_DIR || ''}\0${startDir || process.cwd()}`;
+  const cached = projectRootCache.get(cacheKey);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const root = resolveProjectRoot(startDir);
+  projectRootCache.set(cacheKey, root);
+  return root;
+}
+
+/**
+ * Uncached project root lookup used by findProjectRoot.
+ * 
+ * @param {string} [startDir] - Starting directory for search
+ * @returns {string} Project root path
+ */
+function resolveProjectRoot(startDir = null) {
   // Priority 1: Use CLAUDE_PROJECT_DIR if set by Claude Code
   const claudeProjectDir = process.env.CLAUDE_PROJECT_DIR;
   if (claudeProjectDir && fs.existsSync(claudeProjectDir)) {
@@ -72,20 +95,58 @@ function getMaestroDir(projectRoot = null) {
   return path.join(root, '.maestro');
 }
 
+// .maestro directories already ensured in this process
+const ensuredMaestroDirs = new Set();
+
 /**
  * Ensure .maestro directory exists in project root.
+ * Checked once per directory per process; later calls skip the filesystem.
  * 
  * @param {string} [projectRoot] - Project root path
  * @returns {string} .maestro directory path
  */
 function ensureMaestroDir(projectRoot = null) {
   const maestroDir = getMaestroDir(projectRoot);
-  if (!fs.existsSync(maestroDir)) {
-    fs.mkdirSync(maestroDir, { recursive: true });
+  if (ensuredMaestroDirs.has(maestroDir)) {
+    return maestroDir;
   }
+  // recursive mkdir is already a no-op for an existing directory
+  fs.mkdirSync(maestroDir, { recursive: true });
+  ensuredMaestroDirs.add(maestroDir);
   return maestroDir;
 }
 
+// Meta folders that do not count as project content
+const META_ENTRIES = new Set(['.git', '.maestro', '.claude']);
+
+/**
+ * Check whether a directory holds anything besides meta folders.
+ * Stops at the first non-meta entry instead of listing the whole directory.
+ * 
+ * @param {string} dir - Directory to inspect
+ * @returns {boolean} True if at least one non-meta entry exists
+ */
+function hasProjectFiles(dir) {
+  let handle;
+  try {
+    handle = fs.opendirSync(dir);
+    let entry;
+    while ((entry = handle.readSync()) !== null) {
+      if (!META_ENTRIES.has(entry.name)) {
+        return true;
+      }
+    }
+    return false;
+  } catch (err) {
+    logDebug('[UTILS]', `Error reading ${dir}: ${err.message}`);
+    return true; // Unknown - do not treat as empty
+  } finally {
+    if (handle) {
+      try { handle.closeSync(); } catch (err) { /* ignore */ }
+    }
+  }
+}
+
 /**
  * Get the plugin root directory.
  * 
@@ -95,12 +156,28 @@ function getPluginRoot() {
   return process.env.CLAUDE_PLUGIN_ROOT || path.resolve(__dirname, '..', '..');
 }
 
+// Resolved Claude projects directory (constant for the process lifetime)
+let claudeProjectsDirCache = null;
+
 /**
  * Get the Claude projects directory (cross-platform).
+ * Resolved once per process; the Windows location probe is not repeated.
  * 
  * @returns {string} Claude projects directory path
  */
 function getClaudeProjectsDir() {
+  if (claudeProjectsDirCache === null) {
+    claudeProjectsDirCache = resolveClaudeProjectsDir();
+  }
+  return claudeProjectsDirCache;
+}
+
+/**
+ * Locate the Claude projects directory for the current platform.
+ * 
+ * @returns {string} Claude projects directory path
+ */
+function resolveClaudeProjectsDir() {
   if (process.platform === 'win32') {
     // Windows: Claude Code uses USERPROFILE\.claude\projects (not APPDATA)
     // Check both locations for compatibility
@@ -117,6 +194,9 @@ function getClaudeProjectsDir() {
   return path.join(os.homedir(), '.claude', 'projects');
 }
 
+// Path separators and dots all become dashes in Claude's project folder names
+const PROJECT_PATH_SEPARATORS_RE = /[\\/.]/g;
+
 /**
  * Normalize a project path for Claude's folder naming convention.
  * Claude Code normalizes paths: C:\Users\foo -> C--Users-foo
@@ -130,12 +210,74 @@ function normalizeProjectPath(rawPath) {
     // Force drive letter to uppercase for consistent matching
     drive = drive.toUpperCase();
     // Remove leading slashes and replace all slashes/dots with dashes
-    const normalized = rest.replace(/^[\\/]+/, '').replace(/[\\/]/g, '-').replace(/\./g, '-');
+    const normalized = rest.replace(/^[\\/]+/, '').replace(PROJECT_PATH_SEPARATORS_RE, '-');
     return `${drive}--${normalized}`;
   }
-  return rawPath.replace(/[\\/]/g, '-').replace(/\./g, '-');
+  return rawPath.replace(PROJECT_PATH_SEPARATORS_RE, '-');
+}
+
+// projectRoot -> matching Claude project folder (or null), resolved once per process
+const claudeProjectDirCache = new Map();
+
+/**
+ * Find the Claude projects folder that holds transcripts for a project.
+ * Tries an exact (case-insensitive) name match first, then a prefix match.
+ * 
+ * @param {string} projectRoot - Project root path
+ * @returns {string|null} Project transcript folder or null if none matches
+ */
+function findClaudeProjectDir(projectRoot) {
+  if (claudeProjectDirCache.has(projectRoot)) {
+    return claudeProjectDirCache.get(projectRoot);
+  }
+
+  let projectDir = null;
+  const claudeProjectsDir = getClaudeProjectsDir();
+  try {
+    const cwdLower = normalizeProjectPath(projectRoot).toLowerCase();
+    const entries = fs.readdirSync(claudeProjectsDir);
+    const lowered = entries.map(entry => entry.toLowerCase());
+
+    // 1. Exact match, 2. prefix match in either direction
+    let index = lowered.indexOf(cwdLower);
+    if (index === -1 && cwdLower) {
+      index = lowered.findIndex(entryLower =>
+        entryLower.startsWith(cwdLower) || cwdLower.startsWith(entryLower));
+    }
+    if (index !== -1) {
+      projectDir = path.join(claudeProjectsDir, entries[index]);
+    }
+  } catch (err) {
+    // Missing projects dir - no transcripts
+  }
+
+  claudeProjectDirCache.set(projectRoot, projectDir);
+  return projectDir;
+}
+
+/**
+ * Find the most recently modified .jsonl transcript in a folder.
+ * Single pass, no sort.
+ * 
+ * @param {string} dir - Folder to search
+ * @returns {{name: string, path: string, mtime: number}|null} Newest transcript or null
+ */
+function findLatestJsonl(dir) {
+  let latest = null;
+  for (const name of fs.readdirSync(dir)) {
+    if (!name.endsWith('.jsonl')) continue;
+    const filePath = path.join(dir, name);
+    const mtime = fs.statSync(filePath).mtimeMs;
+    if (!latest || mtime > latest.mtime) {
+      latest = { name, path: filePath, mtime };
+    }
+  }
+  return latest;
 }
 
+// Debug flag, read once per process (hooks are short-lived)
+const DEBUG_ENABLED = process.env.MAESTRO_DEBUG === '1';
+
 /**
  * Log message to stderr (for debugging).
  * Only logs when MAESTRO_DEBUG=1
@@ -144,7 +286,7 @@ function normalizeProjectPath(rawPath) {
  * @param {string} msg - Message to log
  */
 function logDebug(prefix, msg) {
-  if (process.env.MAESTRO_DEBUG === '1') {
+  if (DEBUG_ENABLED) {
     process.stderr.write(`${prefix} ${msg}\n`);
   }
 }
@@ -158,9 +300,7 @@ function logDebug(prefix, msg) {
  */
 function readFileSafe(filePath, maxSize = 100000) {
   try {
-    if (!fs.existsSync(filePath)) {
-      return null;
-    }
+    // stat doubles as the existence check (ENOENT is a normal miss)
     const stats = fs.statSync(filePath);
     if (stats.size > maxSize) {
       logDebug('[UTILS]', `File too large, skipping: ${filePath}`);
@@ -168,7 +308,9 @@ function readFileSafe(filePath, maxSize = 100000) {
     }
     return fs.readFileSync(filePath, 'utf-8');
   } catch (err) {
-    logDebug('[UTILS]', `Error reading ${filePath}: ${err.message}`);
+    if (err.code !== 'ENOENT') {
+      logDebug('[UTILS]', `Error reading ${filePath}: ${err.message}`);
+    }
     return null;
   }
 }
@@ -250,6 +392,46 @@ function outputJson(data) {
   console.log(JSON.stringify(data));
 }
 
+/**
+ * Poll a function with exponential backoff until it returns a truthy value.
+ * Returns as soon as the value is available instead of sleeping a fixed interval.
+ * 
+ * @param {Function} fn - Probe returning a truthy value when ready (may be async)
+ * @param {object} [options] - Polling options
+ * @param {number} [options.timeoutMs=3000] - Give up after this many milliseconds
+ * @param {number} [options.initialDelayMs=50] - First delay between attempts
+ * @param {number} [options.maxDelayMs=500] - Upper bound for a single delay
+ * @param {number} [options.factor=1.6] - Delay growth factor
+ * @param {number} [options.maxAttempts=Infinity] - Give up after this many probes
+ * @returns {Promise<*>} Last probe result (falsy if timed out)
+ */
+async function pollWithBackoff(fn, options = {}) {
+  const {
+    timeoutMs = 3000,
+    initialDelayMs = 50,
+    maxDelayMs = 500,
+    factor = 1.6,
+    maxAttempts = Infinity
+  } = options;
+
+  const deadline = Date.now() + timeoutMs;
+  let delay = initialDelayMs;
+  let attempt = 0;
+  let result;
+
+  while (true) {
+    attempt++;
+    result = await fn(attempt);
+    if (result || attempt >= maxAttempts) return result;
+
+    const remaining = deadline - Date.now();
+    if (remaining <= 0) return result;
+
+    await new Promise(resolve => setTimeout(resolve, Math.min(delay, remaining)));
+    delay = Math.min(delay * factor, maxDelayMs);
+  }
+}
+
 /**
  * Smart truncation - keeps beginning and end for context.
  * 
@@ -288,18 +470,12 @@ function simpleHash(content) {
  */
 function getFileHash(filePath) {
   try {
-    if (!fs.existsSync(filePath)) {
-      return null;
-    }
-    const content = fs.readFileSync(filePath);
-    return simpleHash(content.toString());
+    return simpleHash(fs.readFileSync(filePath, 'utf-8'));
   } catch (err) {
     return null;
   }
 }
 
-const { execSync } = require('child_process');
-
 /**
  * Check if the current project is a Git repository.
  * 
@@ -323,7 +499,14 @@ function isGitProject(projectRoot) {
 function getGitDirtyFiles(projectRoot) {
   try {
     // --porcelain=v1 gives a predictable, machine-readable output
-    const output = execSync('git status --porcelain=v1', { cwd: projectRoot, encoding: 'utf-8' });
+    // Required lazily like crypto in simpleHash: most hook runs never shell out to git.
+    // execFileSync runs git directly, without spawning a shell to parse the command line
+    const { execFileSync } = require('child_process');
+    const output = execFileSync('git', ['status', '--porcelain=v1'], {
+      cwd: projectRoot,
+      encoding: 'utf-8',
+      stdio: ['ignore', 'pipe', 'ignore']
+    });
     return output.split('\n')
       .map(line => line.substring(3).trim())
       .filter(line => line.length > 0);
@@ -333,6 +516,34 @@ function getGitDirtyFiles(projectRoot) {
   }
 }
 
+/**
+ * Write a file atomically (temp file + rename), skipping no-op writes.
+ * A crash mid-write leaves the previous contents intact instead of a truncated file.
+ * 
+ * @param {string} filePath - Destination path
+ * @param {string} content - Content to write
+ * @returns {boolean} True if the file was written, false if unchanged
+ */
+function writeFileAtomic(filePath, content) {
+  try {
+    if (fs.readFileSync(filePath, 'utf-8') === content) {
+      return false;
+    }
+  } catch (err) {
+    // Missing or unreadable - write it
+  }
+
+  const tmpPath = `${filePath}.${process.pid}.tmp`;
+  try {
+    fs.writeFileSync(tmpPath, content, 'utf-8');
+    fs.renameSync(tmpPath, filePath);
+  } catch (err) {
+    try { fs.unlinkSync(tmpPath); } catch (e) { /* ignore */ }
+    throw err;
+  }
+  return true;
+}
+
 /**
  * Save state to .maestro directory.
  * 
@@ -344,7 +555,8 @@ function saveState(name, data, projectRoot = null) {
   try {
     const maestroDir = ensureMaestroDir(projectRoot);
     const stateFile = path.join(maestroDir, `${name}.state`);
-    fs.writeFileSync(stateFile, JSON.stringify(data, null, 2), 'utf-8');
+    // Compact form: state files are machine-read and rewritten on every hook run
+    writeFileAtomic(stateFile, JSON.stringify(data));
   } catch (err) {
     logDebug('[UTILS]', `Error saving state ${name}: ${err.message}`);
   }
@@ -361,15 +573,27 @@ function loadState(name, projectRoot = null) {
   try {
     const maestroDir = getMaestroDir(projectRoot);
     const stateFile = path.join(maestroDir, `${name}.state`);
-    if (fs.existsSync(stateFile)) {
-      return JSON.parse(fs.readFileSync(stateFile, 'utf-8'));
-    }
+    return JSON.parse(fs.readFileSync(stateFile, 'utf-8'));
   } catch (err) {
-    logDebug('[UTILS]', `Error loading state ${name}: ${err.message}`);
+    if (err.code !== 'ENOENT') {
+      logDebug('[UTILS]', `Error loading state ${name}: ${err.message}`);
+    }
   }
   return null;
 }
 
+// Tools that never change project state (built once, checked on every hook run)
+const READ_ONLY_TOOLS = new Set([
+  'view_file', 'Read', 'read_file',
+  'list_dir', 'LS', 'ls', 'dir',
+  'grep_search', 'Grep', 'search',
+  'find_by_name', 'Glob', 'glob',
+  'read_url_content', 'read_browser_page',
+  'list_resources', 'read_resource',
+  'command_status', 'read_terminal',
+  'AskUserQuestion', 'ask'
+]);
+
 /**
  * Check if a tool is read-only (unlikely to change project state).
  * 
@@ -377,31 +601,27 @@ function loadState(name, projectRoot = null) {
  * @returns {boolean} True if read-only
  */
 function isReadOnlyTool(toolName) {
-  const readOnlyTools = [
-    'view_file', 'Read', 'read_file',
-    'list_dir', 'LS', 'ls', 'dir',
-    'grep_search', 'Grep', 'search',
-    'find_by_name', 'Glob', 'glob',
-    'read_url_content', 'read_browser_page',
-    'list_resources', 'read_resource',
-    'command_status', 'read_terminal',
-    'AskUserQuestion', 'ask'
-  ];
-  return readOnlyTools.includes(toolName);
+  return READ_ONLY_TOOLS.has(toolName);
 }
 
 module.exports = {
   findProjectRoot,
   getMaestroDir,
   ensureMaestroDir,
+  META_ENTRIES,
+  hasProjectFiles,
   getPluginRoot,
   getClaudeProjectsDir,
   isGitProject,
   getGitDirtyFiles,
+  writeFileAtomic,
   saveState,
   loadState,
   isReadOnlyTool,
   normalizeProjectPath,
+  findClaudeProjectDir,
+  findLatestJsonl,
+  DEBUG_ENABLED,
   logDebug,
   readFileSafe,
   cleanAnsi,
@@ -409,6 +629,7 @@ module.exports = {
   getTimeOnly,
   readStdin,
   outputJson,
+  pollWithBackoff,
   truncateSmart,
   simpleHash,
   getFileHash
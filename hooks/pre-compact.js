@@ -8,15 +8,14 @@
  * @matcher manual - Triggered by /compact command
  */
 
-const fs = require('fs');
 const path = require('path');
 
 const {
   findProjectRoot,
   getMaestroDir,
   ensureMaestroDir,
-  getClaudeProjectsDir,
-  normalizeProjectPath,
+  findClaudeProjectDir,
+  findLatestJsonl,
   loadState,
   saveState,
   logDebug,
@@ -39,55 +38,14 @@ const LOG_PREFIX = '[PRE-COMPACT]';
  */
 function getCurrentTranscript() {
   try {
-    const claudeProjectsDir = getClaudeProjectsDir();
-    if (!fs.existsSync(claudeProjectsDir)) {
-      return null;
-    }
-
-    const projectRoot = findProjectRoot();
-    const cwdNormalized = normalizeProjectPath(projectRoot);
-    let projectDir = null;
-
-    // Find matching project directory (case-insensitive for Windows compatibility)
-    const entries = fs.readdirSync(claudeProjectsDir);
-    for (const entry of entries) {
-      if (entry.toLowerCase() === cwdNormalized.toLowerCase()) {
-        projectDir = path.join(claudeProjectsDir, entry);
-        break;
-      }
-    }
-
-    // Prefix match fallback (case-insensitive)
-    if (!projectDir) {
-      for (const entry of entries) {
-        const entryLower = entry.toLowerCase();
-        const cwdLower = cwdNormalized.toLowerCase();
-        if (cwdLower && (entryLower.startsWith(cwdLower) || cwdLower.startsWith(entryLower))) {
-          projectDir = path.join(claudeProjectsDir, entry);
-          break;
-        }
-      }
-    }
-
+    const projectDir = findClaudeProjectDir(findProjectRoot());
     if (!projectDir) {
       return null;
     }
 
     // Find most recent JSONL file
-    const jsonlFiles = fs.readdirSync(projectDir)
-      .filter(f => f.endsWith('.jsonl'))
-      .map(f => ({
-        name: f,
-        path: path.join(projectDir, f),
-        mtime: fs.statSync(path.join(projectDir, f)).mtimeMs
-      }))
-      .sort((a, b) => b.mtime - a.mtime);
-
-    if (jsonlFiles.length > 0) {
-      return jsonlFiles[0].path;
-    }
-
-    return null;
+    const latest = findLatestJsonl(projectDir);
+    return latest ? latest.path : null;
   } catch (err) {
     logDebug(LOG_PREFIX, `Error finding transcript: ${err.message}`);
     return null;
@@ -13,9 +13,11 @@ const {
   findProjectRoot,
   getMaestroDir,
   ensureMaestroDir,
+  META_ENTRIES,
   readFileSafe,
-  getFileHash,
+  simpleHash,
   readStdin,
+  pollWithBackoff,
   logDebug,
   outputJson
 } = require('./lib/utils');
@@ -105,40 +107,121 @@ const IMPORTANT_DEPS = {
   'framer-motion': 'Animation (Framer)'
 };
 
+// Range operators stripped from dependency versions (e.g. "^18.2.0" -> "18.2.0")
+const VERSION_RANGE_RE = /[\^~>=<]/g;
+
+/**
+ * Strip semver range operators from a dependency version string.
+ */
+function cleanVersion(version) {
+  return version.replace(VERSION_RANGE_RE, '');
+}
+
+/**
+ * Build an existence check for entries directly under the project root.
+ * Uses the root listing when available, falling back to existsSync.
+ *
+ * @param {string} projectRoot - Project root path
+ * @param {Set<string>} [rootNames] - Names of entries in projectRoot
+ * @returns {Function} name => boolean
+ */
+function makeRootProbe(projectRoot, rootNames = null) {
+  if (rootNames) {
+    return name => rootNames.has(name);
+  }
+  return name => fs.existsSync(path.join(projectRoot, name));
+}
+
+/**
+ * Read a directory's entry names, empty if it is missing or unreadable.
+ *
+ * @param {string} dirPath - Directory path
+ * @returns {Set<string>} Entry names
+ */
+function listDir(dirPath) {
+  try {
+    return new Set(fs.readdirSync(dirPath));
+  } catch (err) {
+    return new Set();
+  }
+}
+
+/**
+ * Build a cached lister for project-relative directories ('.' is the root).
+ * A directory is only read when its parent listing shows it exists, so
+ * probing many paths costs one readdir per directory instead of one stat per path.
+ *
+ * @param {string} projectRoot - Project root path
+ * @param {Set<string>} [rootNames] - Names of entries in projectRoot
+ * @returns {Function} relDir => Set<string>
+ */
+function makeDirLister(projectRoot, rootNames = null) {
+  const cache = new Map([['.', rootNames || listDir(projectRoot)]]);
+
+  return function listing(relDir) {
+    if (cache.has(relDir)) {
+      return cache.get(relDir);
+    }
+    const parent = path.posix.dirname(relDir);
+    const names = listing(parent).has(path.posix.basename(relDir))
+      ? listDir(path.join(projectRoot, relDir))
+      : new Set();
+    cache.set(relDir, names);
+    return names;
+  };
+}
+
+/**
+ * Read package.json once so hashing and analysis share the same content.
+ *
+ * @param {string} projectRoot - Project root path
+ * @returns {string|null} Raw package.json text or null if missing/unreadable
+ */
+function readPackageJson(projectRoot) {
+  try {
+    return fs.readFileSync(path.join(projectRoot, 'package.json'), 'utf-8');
+  } catch (err) {
+    return null;
+  }
+}
+
 /**
- * Check if tech stack needs re-analysis (package.json changed).
+ * Get the package.json hash if the tech stack needs re-analysis.
+ * Returns the current hash when it differs from the stored one (so the caller
+ * can persist it without hashing the file again), or null when unchanged.
+ *
+ * @param {string} projectRoot - Project root path
+ * @param {string|null} pkgContent - Raw package.json text
+ * @returns {string|null} New hash, or null if no re-analysis is needed
  */
-function shouldReanalyzeTech(projectRoot) {
-  const pkgPath = path.join(projectRoot, 'package.json');
+function changedTechHash(projectRoot, pkgContent) {
   const hashFile = path.join(getMaestroDir(projectRoot), '.tech_hash');
 
-  const currentHash = getFileHash(pkgPath);
-  if (!currentHash) {
-    return false; // No package.json
+  if (pkgContent === null) {
+    return null; // No package.json
   }
+  const currentHash = simpleHash(pkgContent);
 
   if (fs.existsSync(hashFile)) {
     try {
       const storedHash = fs.readFileSync(hashFile, 'utf-8').trim();
       if (storedHash === currentHash) {
-        return false; // No change
+        return null; // No change
       }
     } catch (err) {
       // Continue with reanalysis
     }
   }
 
-  return true;
+  return currentHash;
 }
 
 /**
- * Save current package.json hash.
+ * Save package.json hash computed by changedTechHash.
  */
-function saveTechHash(projectRoot) {
-  const pkgPath = path.join(projectRoot, 'package.json');
+function saveTechHash(projectRoot, hash) {
   const hashFile = path.join(ensureMaestroDir(projectRoot), '.tech_hash');
 
-  const hash = getFileHash(pkgPath);
   if (hash) {
     try {
       fs.writeFileSync(hashFile, hash, 'utf-8');
@@ -150,17 +233,24 @@ function saveTechHash(projectRoot) {
 
 /**
  * Analyze package.json and extract tech stack info.
+ * Config and lockfile probes are Set lookups against the root listing.
+ *
+ * @param {string} projectRoot - Project root path
+ * @param {Set<string>} [rootNames] - Names of entries in projectRoot
+ * @param {string} [pkgContent] - Raw package.json text already read by the caller
  */
-function analyzePackageJson(projectRoot) {
-  const pkgPath = path.join(projectRoot, 'package.json');
+function analyzePackageJson(projectRoot, rootNames = null, pkgContent = null) {
+  const rootHas = makeRootProbe(projectRoot, rootNames);
 
-  if (!fs.existsSync(pkgPath)) {
+  if (pkgContent === null && !rootHas('package.json')) {
     logDebug(LOG_PREFIX, 'No package.json found');
     return null;
   }
 
   try {
-    const pkgContent = fs.readFileSync(pkgPath, 'utf-8');
+    if (pkgContent === null) {
+      pkgContent = fs.readFileSync(path.join(projectRoot, 'package.json'), 'utf-8');
+    }
     const pkg = JSON.parse(pkgContent);
 
     const result = {
@@ -192,7 +282,7 @@ function analyzePackageJson(projectRoot) {
             result.frameworks.push(framework);
           }
           // Capture version
-          const version = allDeps[dep].replace(/[\^~>=<]/g, '');
+          const version = cleanVersion(allDeps[dep]);
           result.frameworkVersions[dep] = version;
           break;
         }
@@ -200,7 +290,7 @@ function analyzePackageJson(projectRoot) {
 
       // Check config files
       for (const cfgFile of patterns.files) {
-        if (fs.existsSync(path.join(projectRoot, cfgFile))) {
+        if (rootHas(cfgFile)) {
           if (!result.frameworks.includes(framework)) {
             result.frameworks.push(framework);
           }
@@ -211,17 +301,17 @@ function analyzePackageJson(projectRoot) {
 
     // Always capture React version if present
     if (allDeps['react'] && !result.frameworkVersions['react']) {
-      result.frameworkVersions['react'] = allDeps['react'].replace(/[\^~>=<]/g, '');
+      result.frameworkVersions['react'] = cleanVersion(allDeps['react']);
     }
 
     // Capture TypeScript version
     if (allDeps['typescript']) {
-      result.frameworkVersions['typescript'] = allDeps['typescript'].replace(/[\^~>=<]/g, '');
+      result.frameworkVersions['typescript'] = cleanVersion(allDeps['typescript']);
     }
 
     // Capture Tailwind version
     if (allDeps['tailwindcss']) {
-      result.frameworkVersions['tailwindcss'] = allDeps['tailwindcss'].replace(/[\^~>=<]/g, '');
+      result.frameworkVersions['tailwindcss'] = cleanVersion(allDeps['tailwindcss']);
     }
 
     // Detect important dependencies
@@ -237,7 +327,7 @@ function analyzePackageJson(projectRoot) {
 
       // Check tsconfig for strict mode
       const tsconfigPath = path.join(projectRoot, 'tsconfig.json');
-      if (fs.existsSync(tsconfigPath)) {
+      if (rootHas('tsconfig.json')) {
         try {
           const tsconfig = JSON.parse(fs.readFileSync(tsconfigPath, 'utf-8'));
           if (tsconfig.compilerOptions?.strict) {
@@ -250,12 +340,12 @@ function analyzePackageJson(projectRoot) {
     }
 
     // ESLint
-    if (allDeps['eslint'] || fs.existsSync(path.join(projectRoot, '.eslintrc.js'))) {
+    if (allDeps['eslint'] || rootHas('.eslintrc.js')) {
       result.devTools.push('ESLint');
     }
 
     // Prettier
-    if (allDeps['prettier'] || fs.existsSync(path.join(projectRoot, '.prettierrc'))) {
+    if (allDeps['prettier'] || rootHas('.prettierrc')) {
       result.devTools.push('Prettier');
     }
 
@@ -274,13 +364,13 @@ function analyzePackageJson(projectRoot) {
     }
 
     // Package manager detection
-    if (fs.existsSync(path.join(projectRoot, 'pnpm-lock.yaml'))) {
+    if (rootHas('pnpm-lock.yaml')) {
       result.packageManager = 'pnpm';
-    } else if (fs.existsSync(path.join(projectRoot, 'yarn.lock'))) {
+    } else if (rootHas('yarn.lock')) {
       result.packageManager = 'yarn';
-    } else if (fs.existsSync(path.join(projectRoot, 'package-lock.json'))) {
+    } else if (rootHas('package-lock.json')) {
       result.packageManager = 'npm';
-    } else if (fs.existsSync(path.join(projectRoot, 'bun.lockb'))) {
+    } else if (rootHas('bun.lockb')) {
       result.packageManager = 'bun';
     }
 
@@ -295,8 +385,13 @@ function analyzePackageJson(projectRoot) {
 
 /**
  * Analyze project directory structure.
+ * Root-level probes use the directory listing already read by main()
+ * instead of one existsSync call per candidate.
+ *
+ * @param {string} projectRoot - Project root path
+ * @param {Set<string>} [rootNames] - Names of entries in projectRoot
  */
-function analyzeProjectStructure(projectRoot) {
+function analyzeProjectStructure(projectRoot, rootNames = null) {
   const structure = {
     type: 'unknown',
     patterns: [],
@@ -304,57 +399,57 @@ function analyzeProjectStructure(projectRoot) {
     entryPoints: []
   };
 
+  const rootHas = makeRootProbe(projectRoot, rootNames);
+  const listing = makeDirLister(projectRoot, rootNames);
+  const relHas = relPath => listing(path.posix.dirname(relPath)).has(path.posix.basename(relPath));
+
   // Check for common patterns
-  if (fs.existsSync(path.join(projectRoot, 'app'))) {
+  if (rootHas('app')) {
     structure.patterns.push('App Router (Next.js 13+)');
     structure.keyDirectories.push('app/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'pages'))) {
+  if (rootHas('pages')) {
     structure.patterns.push('Pages Router');
     structure.keyDirectories.push('pages/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'src'))) {
+  if (rootHas('src')) {
     structure.keyDirectories.push('src/');
 
-    // Check src subdirectories
+    // Check src subdirectories (one listing of src/ instead of a stat each)
+    const srcNames = listing('src');
     const srcSubdirs = ['components', 'hooks', 'lib', 'utils', 'services', 'api', 'store', 'types', 'styles'];
     for (const subdir of srcSubdirs) {
-      if (fs.existsSync(path.join(projectRoot, 'src', subdir))) {
+      if (srcNames.has(subdir)) {
         structure.keyDirectories.push(`src/${subdir}/`);
       }
     }
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'components'))) {
+  if (rootHas('components')) {
     structure.keyDirectories.push('components/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'lib'))) {
+  if (rootHas('lib')) {
     structure.keyDirectories.push('lib/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'public'))) {
+  if (rootHas('public')) {
     structure.keyDirectories.push('public/');
   }
 
-  // API routes
-  const apiPaths = [
-    path.join(projectRoot, 'app', 'api'),
-    path.join(projectRoot, 'pages', 'api'),
-    path.join(projectRoot, 'src', 'app', 'api')
-  ];
+  // API routes (answered from cached parent listings)
+  const apiPaths = ['app/api', 'pages/api', 'src/app/api'];
   for (const apiPath of apiPaths) {
-    if (fs.existsSync(apiPath)) {
+    if (relHas(apiPath)) {
       structure.patterns.push('API Routes');
       break;
     }
   }
 
   // Monorepo detection
-  if (fs.existsSync(path.join(projectRoot, 'packages')) ||
-    fs.existsSync(path.join(projectRoot, 'apps'))) {
+  if (rootHas('packages') || rootHas('apps')) {
     structure.type = 'monorepo';
     structure.patterns.push('Monorepo');
   } else {
@@ -362,8 +457,7 @@ function analyzeProjectStructure(projectRoot) {
   }
 
   // Docker
-  if (fs.existsSync(path.join(projectRoot, 'Dockerfile')) ||
-    fs.existsSync(path.join(projectRoot, 'docker-compose.yml'))) {
+  if (rootHas('Dockerfile') || rootHas('docker-compose.yml')) {
     structure.patterns.push('Docker');
   }
 
@@ -374,7 +468,7 @@ function analyzeProjectStructure(projectRoot) {
     'index.ts', 'index.js'
   ];
   for (const entry of entryFiles) {
-    if (fs.existsSync(path.join(projectRoot, entry))) {
+    if (relHas(entry)) {
       structure.entryPoints.push(entry);
     }
   }
@@ -389,27 +483,58 @@ function findActivePlan(projectRoot) {
   const maestroDir = getMaestroDir(projectRoot);
   const planFiles = ['task.md', 'development_plan.md', 'implementation_plan.md'];
 
-  for (const planFile of planFiles) {
-    const planPath = path.join(maestroDir, planFile);
-    if (fs.existsSync(planPath)) {
-      return planPath;
-    }
-  }
+  // One listing of .maestro instead of a stat per candidate (priority order kept)
+  const present = listDir(maestroDir);
+  const planFile = planFiles.find(name => present.has(name));
 
-  return null;
+  return planFile ? path.join(maestroDir, planFile) : null;
 }
 
+// Fixed system message text (built once; only the context body varies)
+const BLACK_SLATE_MESSAGE = `
+# 🎩 MAESTRO: BLACK SLATE PROJECT
+This project directory is effectively EMPTY (except for meta-folders like .git).
+Existing project memory has been PURGED to prevent stale context retrieval.
+
+**INSTRUCTIONS**:
+1. Treat this as a **FRESH START**.
+2. Do NOT attempt to recover context from 'git log' or old memory files.
+3. Architecture, tech stack, and goals should be defined FROM SCRATCH based on user's new request.
+`;
+
+const CONTEXT_HEADER = `
+# 🎩 MAESTRO SESSION CONTEXT
+
+The following context was loaded from project memory and active plans. This represents the **LONG-TERM MEMORY** of the project.
+
+`;
+
+const CONTEXT_FOOTER = `
+
+---
+
+**CRITICAL INSTRUCTIONS**: 
+1. **Memory Continuity**: Review the "Recent Compact Summaries" above. These contain the distilled history of previous interactions. Use them to maintain seamless continuity.
+2. **Context Awareness**: The Tech Stack and Architecture sections define the playground. Use these for high-accuracy searches and implementation decisions.
+3. **Task Tracking**: If \`task.md\` exists, it is the source of truth for current progress. Always keep it updated.
+4. **Communication**: Mirror the user's language mirroring protocol as defined in the Architect roles.
+`;
+
+// Safety cap for pathological (multi-MB) context. Normal memory, including an
+// unbounded compact summary, stays far below it and is never shortened.
+const MAX_CONTEXT_CHARS = 1024 * 1024;
+
 /**
  * Build context message from available files.
+ * Sections that would push the output past MAX_CONTEXT_CHARS are dropped whole.
  */
 function buildContextMessage(projectRoot) {
-  const contextParts = [];
+  const sections = [];
 
   // Check for brain.jsonl (Cross-session memory)
   const brainSummary = formatBrainForContext(projectRoot);
   if (brainSummary) {
-    contextParts.push('## 🧠 Long-Term Project Memory');
-    contextParts.push(brainSummary);
+    sections.push(`## 🧠 Long-Term Project Memory\n${brainSummary}`);
     logDebug(LOG_PREFIX, 'Loaded brain.jsonl summary');
   }
 
@@ -419,20 +544,37 @@ function buildContextMessage(projectRoot) {
     const planContent = readFileSafe(planPath, 30000);
     if (planContent) {
       const planName = path.basename(planPath);
-      contextParts.push(`\n## 📋 Active Plan: ${planName}`);
+      const planParts = [`\n## 📋 Active Plan: ${planName}`];
 
       const lines = planContent.split('\n');
       if (lines.length > 100) {
-        contextParts.push(`(Truncated - ${lines.length} lines)`);
-        contextParts.push(lines.slice(0, 100).join('\n'));
+        planParts.push(`(Truncated - ${lines.length} lines)`);
+        planParts.push(lines.slice(0, 100).join('\n'));
       } else {
-        contextParts.push(planContent);
+        planParts.push(planContent);
       }
+      sections.push(planParts.join('\n'));
       logDebug(LOG_PREFIX, `Loaded plan: ${planName}`);
     }
   }
 
-  return contextParts.length > 0 ? contextParts.join('\n') : null;
+  if (sections.length === 0) {
+    return null;
+  }
+
+  const kept = [];
+  let length = 0;
+  for (const section of sections) {
+    const added = section.length + (kept.length > 0 ? 1 : 0);
+    if (length + added > MAX_CONTEXT_CHARS) {
+      logDebug(LOG_PREFIX, `Context section omitted: ${section.length} chars would exceed ${MAX_CONTEXT_CHARS}`);
+      continue;
+    }
+    kept.push(section);
+    length += added;
+  }
+
+  return kept.length > 0 ? kept.join('\n') : null;
 }
 
 /**
@@ -466,36 +608,30 @@ async function main() {
         logDebug(LOG_PREFIX, `Detected compact/resume session. Attempting summary capture...`);
 
         // RETRY LOOP: Windows I/O and Claude CLI write timing can be tricky.
-        // We try 3 times with 1s intervals.
-        let summary = null;
-        for (let attempt = 1; attempt <= 3; attempt++) {
-          logDebug(LOG_PREFIX, `Capture attempt ${attempt}/3...`);
-
-          summary = extractLastSummary(transcriptPath);
-          if (summary) break;
-
-          if (attempt < 3) {
-            await new Promise(resolve => setTimeout(resolve, 1000));
-          }
-        }
+        // Poll with growing backoff so a ready transcript is picked up immediately,
+        // but never scan more often or wait longer than the old 3 x 1s loop.
+        const summary = await pollWithBackoff((attempt) => {
+          logDebug(LOG_PREFIX, `Capture attempt ${attempt}...`);
+          return extractLastSummary(transcriptPath);
+        }, { timeoutMs: 2000, initialDelayMs: 500, maxDelayMs: 1000, factor: 2, maxAttempts: 3 });
 
         if (summary) {
           writeCompactToBrain(summary, projectRoot);
           logDebug(LOG_PREFIX, 'Summary captured and persisted to brain.jsonl');
         } else {
-          logDebug(LOG_PREFIX, 'Failed to capture summary after 3 attempts.');
+          logDebug(LOG_PREFIX, 'Failed to capture summary before timeout.');
         }
       }
     }
 
     // STALE CONTEXT GUARD: Detect if project is empty (Treat as Black Slate)
     const rootEntries = fs.readdirSync(projectRoot);
-    const hasProjectFiles = rootEntries.some(e => !['.git', '.maestro', '.claude'].includes(e));
+    const rootNames = new Set(rootEntries);
+    const hasProjectFiles = rootEntries.some(e => !META_ENTRIES.has(e));
     if (!hasProjectFiles) {
       logDebug(LOG_PREFIX, 'Project directory empty (except meta) - treated as BLACK SLATE.');
 
       const ts = Date.now();
-      const maestroDir = getMaestroDir(projectRoot);
       const filesToPurge = ['brain.jsonl'];
 
       for (const file of filesToPurge) {
@@ -509,30 +645,23 @@ async function main() {
 
       const output = {
         type: 'session_context',
-        systemMessage: `
-# 🎩 MAESTRO: BLACK SLATE PROJECT
-This project directory is effectively EMPTY (except for meta-folders like .git).
-Existing project memory has been PURGED to prevent stale context retrieval.
-
-**INSTRUCTIONS**:
-1. Treat this as a **FRESH START**.
-2. Do NOT attempt to recover context from 'git log' or old memory files.
-3. Architecture, tech stack, and goals should be defined FROM SCRATCH based on user's new request.
-`
+        systemMessage: BLACK_SLATE_MESSAGE
       };
       outputJson(output);
       return;
     }
 
     // 1. Analyze tech stack if needed (package.json changed or first run)
-    if (shouldReanalyzeTech(projectRoot)) {
+    const pkgContent = rootNames.has('package.json') ? readPackageJson(projectRoot) : null;
+    const techHash = changedTechHash(projectRoot, pkgContent);
+    if (techHash) {
       logDebug(LOG_PREFIX, 'Tech stack analysis triggered');
-      const techInfo = analyzePackageJson(projectRoot);
-      const structure = analyzeProjectStructure(projectRoot);
+      const techInfo = analyzePackageJson(projectRoot, rootNames, pkgContent);
+      const structure = analyzeProjectStructure(projectRoot, rootNames);
 
       if (techInfo) {
         writeTechToBrain(techInfo, structure, projectRoot);
-        saveTechHash(projectRoot);
+        saveTechHash(projectRoot, techHash);
         logDebug(LOG_PREFIX, 'Tech stack info written to brain.jsonl');
       }
     } else {
@@ -545,21 +674,7 @@ Existing project memory has been PURGED to prevent stale context retrieval.
     if (context) {
       const output = {
         type: 'session_context',
-        systemMessage: `
-# 🎩 MAESTRO SESSION CONTEXT
-
-The following context was loaded from project memory and active plans. This represents the **LONG-TERM MEMORY** of the project.
-
-${context}
-
----
-
-**CRITICAL INSTRUCTIONS**: 
-1. **Memory Continuity**: Review the "Recent Compact Summaries" above. These contain the distilled history of previous interactions. Use them to maintain seamless continuity.
-2. **Context Awareness**: The Tech Stack and Architecture sections define the playground. Use these for high-accuracy searches and implementation decisions.
-3. **Task Tracking**: If \`task.md\` exists, it is the source of truth for current progress. Always keep it updated.
-4. **Communication**: Mirror the user's language mirroring protocol as defined in the Architect roles.
-`
+        systemMessage: CONTEXT_HEADER + context + CONTEXT_FOOTER
       };
       outputJson(output);
       logDebug(LOG_PREFIX, 'Context injected successfully');
@@ -11,23 +11,32 @@
 const fs = require('fs');
 const path = require('path');
 
+// Directories never worth descending into (dependencies, VCS, Maestro state)
+const SKIP_DIRS = new Set(['node_modules', '.git', '.maestro']);
+
 /**
  * Recursively find all files in a directory.
+ * Skipped directories are pruned before descending; entry types come
+ * from readdir, so no stat call is needed per entry.
  */
 function walkDir(dir, fileList = []) {
   try {
-    const files = fs.readdirSync(dir);
-    for (const file of files) {
-      const filePath = path.join(dir, file);
-      try {
-        const stat = fs.statSync(filePath);
-        if (stat.isDirectory()) {
+    const entries = fs.readdirSync(dir, { withFileTypes: true });
+    for (const entry of entries) {
+      const filePath = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        if (!SKIP_DIRS.has(entry.name)) {
           walkDir(filePath, fileList);
-        } else {
-          fileList.push(filePath);
         }
-      } catch (err) {
-        // Skip inaccessible
+      } else if (entry.isFile()) {
+        fileList.push(filePath);
+      } else if (entry.isSymbolicLink()) {
+        // Only links need a stat to learn what they point at
+        try {
+          if (fs.statSync(filePath).isFile()) fileList.push(filePath);
+        } catch (err) {
+          // Skip dangling links
+        }
       }
     }
   } catch (err) {
@@ -95,9 +104,7 @@ function main() {
     try {
       const projectRoot = process.cwd();
       const stateDir = path.join(projectRoot, '.maestro');
-      if (!fs.existsSync(stateDir)) {
-        fs.mkdirSync(stateDir, { recursive: true });
-      }
+      fs.mkdirSync(stateDir, { recursive: true });
       fs.writeFileSync(path.join(stateDir, 'audit.state'), String(Date.now() / 1000));
     } catch (err) {
       console.log(`[WARN] Could not save audit state: ${err.message}`);
@@ -108,4 +115,12 @@ function main() {
   }
 }
 
-main();
+// Export for module use
+module.exports = {
+  walkDir,
+  auditAssets
+};
+
+if (require.main === module) {
+  main();
+}
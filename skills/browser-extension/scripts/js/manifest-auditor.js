@@ -60,6 +60,17 @@ function auditManifest(filepath) {
   return issues;
 }
 
+/**
+ * Stat a path, returning null if it does not exist or cannot be accessed.
+ */
+function statOrNull(target) {
+  try {
+    return fs.statSync(target, { throwIfNoEntry: false }) || null;
+  } catch (err) {
+    return null;
+  }
+}
+
 /**
  * Main function.
  */
@@ -68,11 +79,14 @@ function main() {
 
   let target = process.argv[2] || 'manifest.json';
 
-  if (fs.existsSync(target) && fs.statSync(target).isDirectory()) {
+  // One stat answers both "is it a directory" and "does it exist"
+  let stat = statOrNull(target);
+  if (stat && stat.isDirectory()) {
     target = path.join(target, 'manifest.json');
+    stat = statOrNull(target);
   }
 
-  if (!fs.existsSync(target)) {
+  if (!stat) {
     console.log(`[SKIP] ${target} not found. Skipping manifest audit.`);
     return;
   }
@@ -90,9 +104,7 @@ function main() {
     try {
       const projectRoot = process.cwd();
       const stateDir = path.join(projectRoot, '.maestro');
-      if (!fs.existsSync(stateDir)) {
-        fs.mkdirSync(stateDir, { recursive: true });
-      }
+      fs.mkdirSync(stateDir, { recursive: true });
       fs.writeFileSync(path.join(stateDir, 'audit.state'), String(Date.now() / 1000));
     } catch (err) {
       console.log(`[WARN] Could not save audit state: ${err.message}`);
@@ -103,4 +115,11 @@ function main() {
   }
 }
 
-main();
+// Export for module use
+module.exports = {
+  auditManifest
+};
+
+if (require.main === module) {
+  main();
+}
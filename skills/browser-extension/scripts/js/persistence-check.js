@@ -70,9 +70,7 @@ function main() {
     try {
       const projectRoot = process.cwd();
       const stateDir = path.join(projectRoot, '.maestro');
-      if (!fs.existsSync(stateDir)) {
-        fs.mkdirSync(stateDir, { recursive: true });
-      }
+      fs.mkdirSync(stateDir, { recursive: true });
       fs.writeFileSync(path.join(stateDir, 'audit.state'), String(Date.now() / 1000));
     } catch (err) {
       console.log(`[WARN] Could not save audit state: ${err.message}`);
@@ -83,4 +81,11 @@ function main() {
   }
 }
 
-main();
+// Export for module use
+module.exports = {
+  checkPersistence
+};
+
+if (require.main === module) {
+  main();
+}
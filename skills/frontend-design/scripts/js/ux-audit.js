@@ -42,6 +42,19 @@ const CONFIG = {
   }
 };
 
+// Extensions collected by the walker vs. extensions actually audited by scanFile
+const FRONTEND_EXTENSIONS = new Set(['.tsx', '.jsx', '.vue', '.svelte', '.html', '.css', '.svg', '.js', '.ts']);
+const SCANNABLE_EXTENSIONS = new Set(['.tsx', '.jsx', '.ts', '.js', '.vue', '.svelte', '.css']);
+
+// Files above this size are bundles/generated output, not hand-written UI code
+const MAX_SCAN_BYTES = 1024 * 1024;
+// Leading bytes inspected for NUL when sniffing binary content
+const BINARY_SNIFF_BYTES = 8000;
+
+// Patterns used on every scanned file, compiled once
+const ANIMATE_PROPS_RE = /animate=\{\{([^}]+)\}\}/;
+const TRANSITION_CLASS_RE = /transition-[a-z]+/;
+
 /**
  * Scan a single file for design & security violations.
  */
@@ -49,19 +62,27 @@ function scanFile(filepath) {
   const issues = [];
   let content = '';
 
-  try {
-    content = fs.readFileSync(filepath, 'utf-8');
-  } catch (err) {
-    return [`[ERROR] Could not read file: ${err.message}`];
-  }
-
   const ext = path.extname(filepath);
 
-  // Skip non-code files
-  if (!['.tsx', '.jsx', '.ts', '.js', '.vue', '.svelte', '.css'].includes(ext)) {
+  // Skip non-code files before paying for the read
+  if (!SCANNABLE_EXTENSIONS.has(ext)) {
     return [];
   }
 
+  try {
+    // Size check before reading so large bundles are never loaded
+    if (fs.statSync(filepath).size > MAX_SCAN_BYTES) {
+      return [];
+    }
+    const buffer = fs.readFileSync(filepath);
+    if (buffer.subarray(0, BINARY_SNIFF_BYTES).includes(0)) {
+      return [];
+    }
+    content = buffer.toString('utf-8');
+  } catch (err) {
+    return [`[ERROR] Could not read file: ${err.message}`];
+  }
+
   const isCss = ext === '.css';
   const isArtComponent = filepath.toLowerCase().includes('visual') ||
     filepath.toLowerCase().includes('art') ||
@@ -77,7 +98,7 @@ function scanFile(filepath) {
     }
 
     // B. Jank Check (Layout Thrashing)
-    const animatingProps = content.match(/animate=\{\{([^}]+)\}\}/);
+    const animatingProps = content.match(ANIMATE_PROPS_RE);
     if (animatingProps) {
       CONFIG.motion.jank.forEach(prop => {
         if (animatingProps[1].includes(prop)) {
@@ -85,7 +106,7 @@ function scanFile(filepath) {
         }
       });
     }
-    if (content.match(/transition-[a-z]+/)) {
+    if (TRANSITION_CLASS_RE.test(content)) {
       if (content.includes('transition-all')) {
         issues.push(`[PERF-JANK] 'transition-all' is lazy and non-performant. Specify properties (opacity, transform).`);
       }
@@ -166,70 +187,114 @@ function scanFile(filepath) {
   return issues;
 }
 
+// Directories never worth descending into
+const SKIP_DIRS = new Set(['node_modules', '.git', '.maestro', 'dist', 'build', '.next']);
+
 /**
- * Recursive File Finder
+ * File Finder
+ * Iterative walk over directory entries; skipped directories are pruned
+ * before descending and entry types come from readdir (only symlinks are stat'ed).
+ * Entries are pushed in reverse so files come out in the same depth-first,
+ * readdir order as a recursive walk. Links to files are audited; links to
+ * directories are not followed.
  */
 function findFiles(dir, extensions) {
-  let results = [];
-  try {
-    const list = fs.readdirSync(dir);
-    list.forEach(file => {
-      const fullPath = path.join(dir, file);
-      if (['node_modules', '.git', '.maestro', 'dist', 'build', '.next'].includes(file)) return;
-
-      const stat = fs.statSync(fullPath);
-      if (stat && stat.isDirectory()) {
-        results = results.concat(findFiles(fullPath, extensions));
-      } else {
-        if (extensions.includes(path.extname(file))) {
-          results.push(fullPath);
+  const results = [];
+  const stack = [{ fullPath: dir, isDir: true }];
+
+  while (stack.length > 0) {
+    const { fullPath, isDir } = stack.pop();
+    if (!isDir) {
+      results.push(fullPath);
+      continue;
+    }
+
+    let entries;
+    try {
+      entries = fs.readdirSync(fullPath, { withFileTypes: true });
+    } catch (err) {
+      continue;
+    }
+
+    for (let i = entries.length - 1; i >= 0; i--) {
+      const entry = entries[i];
+      const entryPath = path.join(fullPath, entry.name);
+      if (entry.isDirectory()) {
+        if (!SKIP_DIRS.has(entry.name)) {
+          stack.push({ fullPath: entryPath, isDir: true });
         }
+      } else if (extensions.has(path.extname(entry.name)) && isAuditableFile(entry, entryPath)) {
+        stack.push({ fullPath: entryPath, isDir: false });
       }
-    });
-  } catch (err) { }
+    }
+  }
+
   return results;
 }
 
+/**
+ * Regular files are taken as-is; links are kept only if they point at a file.
+ */
+function isAuditableFile(entry, entryPath) {
+  if (entry.isFile()) return true;
+  if (!entry.isSymbolicLink()) return false;
+  try {
+    return fs.statSync(entryPath).isFile();
+  } catch (err) {
+    return false; // Dangling link
+  }
+}
+
 /**
  * Main Execution
+ * The report is collected into one buffer and written once, not line by line.
  */
 function main() {
-  console.log('\n🔍 MAESTRO ELITE FRONTEND AUDITOR (2025 Protocol)\n' + '='.repeat(50));
+  const out = ['\n🔍 MAESTRO ELITE FRONTEND AUDITOR (2025 Protocol)\n' + '='.repeat(50)];
 
   const targetDir = process.argv[2] || '.';
-  const extensions = ['.tsx', '.jsx', '.vue', '.svelte', '.html', '.css', '.svg', '.js', '.ts'];
-
-  const files = findFiles(targetDir, extensions);
+  const files = findFiles(targetDir, FRONTEND_EXTENSIONS);
   let totalIssues = 0;
 
   if (files.length === 0) {
-    console.log(`ℹ️  No frontend files found to audit in: ${targetDir}`);
+    out.push(`ℹ️  No frontend files found to audit in: ${targetDir}`);
+    console.log(out.join('\n'));
     return;
   }
 
-  console.log(`\nScanning ${files.length} files for Architectural, Motion & Art violations...\n`);
+  out.push(`\nScanning ${files.length} files for Architectural, Motion & Art violations...\n`);
 
   files.forEach(file => {
     const issues = scanFile(file);
     if (issues.length > 0) {
-      console.log(`📂 ${path.relative(process.cwd(), file)}`);
+      out.push(`📂 ${path.relative(process.cwd(), file)}`);
       issues.forEach(issue => {
-        console.log(`   ❌ ${issue}`);
+        out.push(`   ❌ ${issue}`);
         totalIssues++;
       });
-      console.log('');
+      out.push('');
     }
   });
 
-  console.log('='.repeat(50));
+  out.push('='.repeat(50));
   if (totalIssues > 0) {
-    console.log(`🚨 FAILURE: ${totalIssues} violations found.`);
-    console.log(`   Action: Check 'frontend_reference.md', 'animation_reference.md', or 'css_art_reference.md'`);
+    out.push(`🚨 FAILURE: ${totalIssues} violations found.`);
+    out.push(`   Action: Check 'frontend_reference.md', 'animation_reference.md', or 'css_art_reference.md'`);
+    console.log(out.join('\n'));
     process.exit(1);
   } else {
-    console.log(`✅ SUCCESS: System Integrity Verified (Art, Motion, Logic, Security).`);
+    out.push(`✅ SUCCESS: System Integrity Verified (Art, Motion, Logic, Security).`);
+    console.log(out.join('\n'));
     process.exit(0);
   }
 }
 
-main();
+// Export for module use
+module.exports = {
+  scanFile,
+  findFiles
+};
+
+if (require.main === module) {
+  main();
+}
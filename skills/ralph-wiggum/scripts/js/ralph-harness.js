@@ -20,6 +20,80 @@ const path = require('path');
 const crypto = require('crypto');
 const { spawnSync } = require('child_process');
 
+// Pivot instructions per circuit-breaker strategy (static text, built once)
+const PIVOT_GUIDANCE = {
+  different_algorithm: `
+🔄 PIVOT STRATEGY: Different Algorithm
+
+The same error keeps occurring. The current approach is fundamentally flawed.
+
+ACTION REQUIRED:
+1. STOP what you're doing
+2. Delete or comment out the problematic code
+3. Research alternative algorithms for this problem
+4. Start with a completely different approach
+5. Run tests after each small change
+
+DO NOT: Try to patch the existing code again.
+`,
+  break_into_pieces: `
+🔄 PIVOT STRATEGY: Divide and Conquer
+
+The problem is too complex to solve at once.
+
+ACTION REQUIRED:
+1. Identify the smallest testable unit
+2. Create a separate function for just that unit
+3. Write a test for just that function
+4. Make the test pass
+5. Only then add the next piece
+
+DO NOT: Try to implement everything at once.
+`,
+  ask_clarification: `
+🔄 PIVOT STRATEGY: Seek Clarification
+
+After many attempts, the requirements may be unclear or impossible.
+
+ACTION REQUIRED:
+1. STOP implementation attempts
+2. List the specific blockers encountered
+3. Formulate clear questions about requirements
+4. Ask the user for clarification
+5. Do NOT proceed until requirements are clear
+
+DO NOT: Keep trying the same approach.
+`,
+  check_dependencies: `
+🔄 PIVOT STRATEGY: Check Dependencies
+
+Import errors suggest missing or misconfigured dependencies.
+
+ACTION REQUIRED:
+1. Check if all required packages are installed
+2. Verify package versions match requirements
+3. Check virtual environment activation
+4. Run: npm install / pip install -r requirements.txt
+5. Check for circular imports
+
+DO NOT: Assume imports will magically work.
+`,
+  rollback: `
+🔄 PIVOT STRATEGY: Rollback to Stable State
+
+Recent changes broke something that was working.
+
+ACTION REQUIRED:
+1. Find the last known working commit
+2. Run: git stash (save current work)
+3. Run: git checkout <last-good-commit>
+4. Verify tests pass
+5. Reapply changes more carefully
+
+DO NOT: Keep building on broken foundation.
+`
+};
+
 /**
  * CircuitBreaker - Enhanced Circuit Breaker with intelligent pivot strategies.
  */
@@ -53,17 +127,18 @@ class CircuitBreaker {
 
   _saveState() {
     const dir = path.dirname(this.stateFile);
-    if (!fs.existsSync(dir)) {
-      fs.mkdirSync(dir, { recursive: true });
-    }
+    fs.mkdirSync(dir, { recursive: true });
 
-    fs.writeFileSync(this.stateFile, JSON.stringify({
+    // Temp file + rename: an interrupted run never leaves a truncated state file
+    const tmpFile = `${this.stateFile}.${process.pid}.tmp`;
+    fs.writeFileSync(tmpFile, JSON.stringify({
       error_history: this.errorHistory.slice(-20),
       iteration_count: this.iterationCount,
       pivot_count: this.pivotCount,
       last_stable_commit: this.lastStableCommit,
       updated_at: new Date().toISOString()
-    }, null, 2));
+    }));
+    fs.renameSync(tmpFile, this.stateFile);
   }
 
   recordError(errorOutput, exitCode) {
@@ -144,80 +219,7 @@ class CircuitBreaker {
   }
 
   getPivotGuidance(strategy) {
-    const guidance = {
-      different_algorithm: `
-🔄 PIVOT STRATEGY: Different Algorithm
-
-The same error keeps occurring. The current approach is fundamentally flawed.
-
-ACTION REQUIRED:
-1. STOP what you're doing
-2. Delete or comment out the problematic code
-3. Research alternative algorithms for this problem
-4. Start with a completely different approach
-5. Run tests after each small change
-
-DO NOT: Try to patch the existing code again.
-`,
-      break_into_pieces: `
-🔄 PIVOT STRATEGY: Divide and Conquer
-
-The problem is too complex to solve at once.
-
-ACTION REQUIRED:
-1. Identify the smallest testable unit
-2. Create a separate function for just that unit
-3. Write a test for just that function
-4. Make the test pass
-5. Only then add the next piece
-
-DO NOT: Try to implement everything at once.
-`,
-      ask_clarification: `
-🔄 PIVOT STRATEGY: Seek Clarification
-
-After many attempts, the requirements may be unclear or impossible.
-
-ACTION REQUIRED:
-1. STOP implementation attempts
-2. List the specific blockers encountered
-3. Formulate clear questions about requirements
-4. Ask the user for clarification
-5. Do NOT proceed until requirements are clear
-
-DO NOT: Keep trying the same approach.
-`,
-      check_dependencies: `
-🔄 PIVOT STRATEGY: Check Dependencies
-
-Import errors suggest missing or misconfigured dependencies.
-
-ACTION REQUIRED:
-1. Check if all required packages are installed
-2. Verify package versions match requirements
-3. Check virtual environment activation
-4. Run: npm install / pip install -r requirements.txt
-5. Check for circular imports
-
-DO NOT: Assume imports will magically work.
-`,
-      rollback: `
-🔄 PIVOT STRATEGY: Rollback to Stable State
-
-Recent changes broke something that was working.
-
-ACTION REQUIRED:
-1. Find the last known working commit
-2. Run: git stash (save current work)
-3. Run: git checkout <last-good-commit>
-4. Verify tests pass
-5. Reapply changes more carefully
-
-DO NOT: Keep building on broken foundation.
-`
-    };
-
-    return guidance[strategy] || `Unknown strategy: ${strategy}`;
+    return PIVOT_GUIDANCE[strategy] || `Unknown strategy: ${strategy}`;
   }
 
   recordSuccess() {
@@ -243,17 +245,30 @@ DO NOT: Keep building on broken foundation.
   }
 }
 
+// Captured output cap per stream; spawnSync kills the child once it is exceeded
+const AUDIT_MAX_BUFFER = 16 * 1024 * 1024;
+
 /**
  * Run audit command and return status + output.
+ * A null status (killed by signal or output overflow) counts as failure.
  */
 function runAudit(command, cwd = null) {
   try {
     const result = spawnSync(command, {
       shell: true,
       encoding: 'utf-8',
-      cwd: cwd || process.cwd()
+      cwd: cwd || process.cwd(),
+      stdio: ['ignore', 'pipe', 'pipe'],
+      maxBuffer: AUDIT_MAX_BUFFER
     });
-    return [result.status || 0, (result.stdout || '') + (result.stderr || '')];
+    let output = (result.stdout || '') + (result.stderr || '');
+    if (result.error) {
+      output += `\n${result.error.message}`;
+    }
+    if (result.status === null) {
+      return [1, output + (result.signal ? `\nTerminated by ${result.signal}` : '')];
+    }
+    return [result.status, output];
   } catch (err) {
     return [1, err.message];
   }
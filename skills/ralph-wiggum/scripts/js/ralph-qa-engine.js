@@ -59,13 +59,14 @@ class RalphSurgicalEngine {
   }
 
   _saveState() {
-    if (!fs.existsSync(this.stateDir)) {
-      fs.mkdirSync(this.stateDir, { recursive: true });
-    }
-    fs.writeFileSync(this.stateFile, JSON.stringify({
+    fs.mkdirSync(this.stateDir, { recursive: true });
+    // Temp file + rename: an interrupted run never leaves a truncated state file
+    const tmpFile = `${this.stateFile}.${process.pid}.tmp`;
+    fs.writeFileSync(tmpFile, JSON.stringify({
       ...this.state,
       updated_at: new Date().toISOString()
-    }, null, 2));
+    }));
+    fs.renameSync(tmpFile, this.stateFile);
   }
 
   // =========================================================================
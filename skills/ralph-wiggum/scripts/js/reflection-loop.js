@@ -30,6 +30,21 @@ const IssueCategory = {
   INCOMPLETE_IMPLEMENTATION: 'incomplete_implementation'
 };
 
+// Static-analysis patterns, pre-lowercased once since they are matched against lowercased code
+const lowerAll = patterns => patterns.map(p => p.toLowerCase());
+
+const EDGE_CASE_PATTERNS = {
+  empty: lowerAll(['if not ', 'if len(', 'is None', '=== null', '!= null', '!== undefined']),
+  null: lowerAll(['is None', 'is not None', '=== null', '!== null', '!= null']),
+  zero: lowerAll(['== 0', '=== 0', '> 0', '< 0', '<= 0', '>= 0']),
+  negative: lowerAll(['< 0', '<= 0', 'is_negative', 'abs(', 'Math.abs']),
+  overflow: lowerAll(['MAX_', 'MIN_', 'overflow', 'MAX_SAFE', 'Number.MAX'])
+};
+
+const SQL_INJECTION_PATTERNS = lowerAll(['f"SELECT', "f'SELECT", '+ sql', '% sql', '.format(sql', '`SELECT']);
+
+const SECRET_PATTERNS = lowerAll(['password = "', 'api_key = "', 'secret = "', 'token = "', "password = '", "apiKey = '"]);
+
 /**
  * ReflectionIssue - An issue found during code reflection.
  */
@@ -165,16 +180,8 @@ class ReflectionLoop {
     const issues = [];
     const codeLower = code.toLowerCase();
 
-    const edgeCasePatterns = {
-      empty: ['if not ', 'if len(', 'is None', '=== null', '!= null', '!== undefined'],
-      null: ['is None', 'is not None', '=== null', '!== null', '!= null'],
-      zero: ['== 0', '=== 0', '> 0', '< 0', '<= 0', '>= 0'],
-      negative: ['< 0', '<= 0', 'is_negative', 'abs(', 'Math.abs'],
-      overflow: ['MAX_', 'MIN_', 'overflow', 'MAX_SAFE', 'Number.MAX']
-    };
-
-    for (const [edgeType, patterns] of Object.entries(edgeCasePatterns)) {
-      if (!patterns.some(p => codeLower.includes(p.toLowerCase()))) {
+    for (const [edgeType, patterns] of Object.entries(EDGE_CASE_PATTERNS)) {
+      if (!patterns.some(p => codeLower.includes(p))) {
         if (['empty', 'null'].includes(edgeType)) {
           issues.push(new ReflectionIssue(
             IssueCategory.EDGE_CASE_MISSING,
@@ -255,11 +262,11 @@ class ReflectionLoop {
 
   _checkSecurity(code) {
     const issues = [];
+    const codeLower = code.toLowerCase();
 
     // SQL injection patterns
-    const sqlPatterns = ['f"SELECT', "f'SELECT", '+ sql', '% sql', '.format(sql', '`SELECT'];
-    for (const pattern of sqlPatterns) {
-      if (code.toLowerCase().includes(pattern.toLowerCase())) {
+    for (const pattern of SQL_INJECTION_PATTERNS) {
+      if (codeLower.includes(pattern)) {
         issues.push(new ReflectionIssue(
           IssueCategory.SECURITY_VULNERABILITY,
           IssueSeverity.CRITICAL,
@@ -283,9 +290,8 @@ class ReflectionLoop {
     }
 
     // Hardcoded secrets
-    const secretPatterns = ['password = "', 'api_key = "', 'secret = "', 'token = "', "password = '", "apiKey = '"];
-    for (const pattern of secretPatterns) {
-      if (code.toLowerCase().includes(pattern.toLowerCase())) {
+    for (const pattern of SECRET_PATTERNS) {
+      if (codeLower.includes(pattern)) {
         issues.push(new ReflectionIssue(
           IssueCategory.SECURITY_VULNERABILITY,
           IssueSeverity.CRITICAL,
@@ -339,7 +345,23 @@ class ReflectionLoop {
       return '✅ No refinement needed. Code passes all checks.';
     }
 
-    let guidance = `
+    // Bucket issues by severity in one pass
+    const buckets = {
+      [IssueSeverity.CRITICAL]: [],
+      [IssueSeverity.MAJOR]: [],
+      [IssueSeverity.MINOR]: []
+    };
+    for (const issue of result.issues) {
+      if (buckets[issue.severity]) {
+        buckets[issue.severity].push(issue);
+      }
+    }
+    const critical = buckets[IssueSeverity.CRITICAL];
+    const major = buckets[IssueSeverity.MAJOR];
+    const minor = buckets[IssueSeverity.MINOR];
+
+    // Collect fragments and join once instead of growing a string with +=
+    const parts = [`
 ## 🔄 REFLECTION LOOP - Iteration ${result.iteration}
 
 **Overall Severity:** ${result.overallSeverity.toUpperCase()}
@@ -347,42 +369,38 @@ class ReflectionLoop {
 
 ### Issues to Address:
 
-`;
-
-    const critical = result.issues.filter(i => i.severity === IssueSeverity.CRITICAL);
-    const major = result.issues.filter(i => i.severity === IssueSeverity.MAJOR);
-    const minor = result.issues.filter(i => i.severity === IssueSeverity.MINOR);
+`];
 
     if (critical.length > 0) {
-      guidance += '#### 🔴 CRITICAL (Must Fix):\n';
+      parts.push('#### 🔴 CRITICAL (Must Fix):\n');
       critical.forEach((issue, i) => {
-        guidance += `
+        parts.push(`
 ${i + 1}. **${issue.category}** at \`${issue.location}\`
    - Problem: ${issue.description}
    - Fix: ${issue.suggestedFix}
-`;
+`);
       });
     }
 
     if (major.length > 0) {
-      guidance += '\n#### 🟠 MAJOR (Should Fix):\n';
+      parts.push('\n#### 🟠 MAJOR (Should Fix):\n');
       major.forEach((issue, i) => {
-        guidance += `
+        parts.push(`
 ${i + 1}. **${issue.category}** at \`${issue.location}\`
    - Problem: ${issue.description}
    - Fix: ${issue.suggestedFix}
-`;
+`);
       });
     }
 
     if (minor.length > 0) {
-      guidance += '\n#### 🟡 MINOR (Nice to Fix):\n';
+      parts.push('\n#### 🟡 MINOR (Nice to Fix):\n');
       minor.forEach((issue, i) => {
-        guidance += `${i + 1}. ${issue.description} → ${issue.suggestedFix}\n`;
+        parts.push(`${i + 1}. ${issue.description} → ${issue.suggestedFix}\n`);
       });
     }
 
-    guidance += `
+    parts.push(`
 ### Next Steps:
 1. Address all CRITICAL issues first
 2. Then fix MAJOR issues
@@ -390,8 +408,8 @@ ${i + 1}. **${issue.category}** at \`${issue.location}\`
 4. Repeat until no CRITICAL/MAJOR issues remain
 
 **Iteration Limit:** ${this.maxIterations - result.iteration} remaining
-`;
-    return guidance;
+`);
+    return parts.join('');
   }
 
   getLoopStatus() {